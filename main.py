@@ -1,8 +1,7 @@
-from utils.file_handler import (
-    read_sales_data,
-    parse_transactions,
-    validate_and_filter
-)
+import sys
+
+from utils.file_handler import validate_and_filter
+from utils.ingestion import read_sales_sources
 
 from utils.data_processor import (
     calculate_total_revenue,
@@ -15,15 +14,11 @@ from utils.data_processor import (
     generate_sales_report
 )
 
-from utils.api_handler import (
-    fetch_all_products,
-    create_product_mapping,
-    enrich_sales_data,
-    save_enriched_data
-)
+
+DEFAULT_SOURCE = "data/sales_data.txt"
 
 
-def main():
+def main(source=DEFAULT_SOURCE):
     print("=" * 40)
     print("SALES ANALYTICS SYSTEM")
     print("=" * 40)
@@ -31,13 +26,15 @@ def main():
     try:
         # [1/10] Read file
         print("\n[1/10] Reading sales data...")
-        raw = read_sales_data("data/sales_data.txt")
-        print(f"✓ Successfully read {len(raw)} transactions")
+        parsed, ingest_summary = read_sales_sources(source)
+        print(f"✓ Successfully read {ingest_summary['raw_lines']} transactions "
+              f"from {ingest_summary['files']} file(s)")
 
         # [2/10] Parse
         print("\n[2/10] Parsing and cleaning data...")
-        parsed = parse_transactions(raw)
         print(f"✓ Parsed {len(parsed)} records")
+        if ingest_summary['duplicates']:
+            print(f"✓ Removed {ingest_summary['duplicates']} duplicate transactions")
 
         # [3/10] Filter options
         regions = sorted(set(t["Region"] for t in parsed))
@@ -78,6 +75,13 @@ def main():
 
         # [6/10] API fetch
         print("\n[6/10] Fetching product data from API...")
+        # Imported here so runs that stop earlier never load the HTTP stack
+        from utils.api_handler import (
+            fetch_all_products,
+            create_product_mapping,
+            enrich_sales_data,
+            save_enriched_data
+        )
         api_products = fetch_all_products()
         print(f"✓ Fetched {len(api_products)} products")
 
@@ -112,4 +116,13 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    args = sys.argv[1:]
+
+    # Datasets larger than memory: streamed, spilled to disk and aggregated
+    # per partition (see utils/out_of_core.py)
+    if args[:1] == ["--out-of-core"]:
+        from utils.out_of_core import main as out_of_core_main
+        sys.exit(out_of_core_main(args[1:]))
+
+    # Optional sources: files, directories or glob patterns
+    main(args or DEFAULT_SOURCE)
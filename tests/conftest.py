@@ -0,0 +1,254 @@
+# tests/conftest.py
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+
+import pytest
+
+from utils.file_handler import read_sales_data, parse_transactions, validate_and_filter
+from utils.api_handler import create_product_mapping
+
+FIXTURES = Path(__file__).parent / "fixtures"
+SAMPLE_FILE = FIXTURES / "sales_data.txt"
+CATALOG_FILE = FIXTURES / "catalog.json"
+GOLDEN_REPORT = FIXTURES / "golden_sales_report.txt"
+GOLDEN_ENRICHED = FIXTURES / "golden_enriched_sales_data.txt"
+PERF_BASELINE = FIXTURES / "perf_baseline.json"
+
+DEFAULT_TOLERANCE = 0.4
+
+# Peak memory differences below this are treated as noise
+MEMORY_SLACK_KB = 64
+
+# Measurement passes combined (median) when storing a baseline
+BASELINE_PASSES = 3
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf", "performance baseline")
+    group.addoption("--perf", action="store_true",
+                    help="run the benchmarks marked 'perf'")
+    group.addoption("--perf-tolerance", type=float, default=DEFAULT_TOLERANCE,
+                    help="allowed throughput/peak-memory regression as a fraction")
+    group.addoption("--perf-update-baseline", action="store_true",
+                    help="store the measured results as the new baseline instead of checking")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--perf"):
+        return
+    skip = pytest.mark.skip(reason="benchmark; run with --perf")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip)
+
+
+# ---------- sample data ----------
+
+@pytest.fixture(scope="session")
+def sample_raw():
+    return read_sales_data(str(SAMPLE_FILE))
+
+
+@pytest.fixture(scope="session")
+def sample_parsed(sample_raw):
+    return parse_transactions(sample_raw)
+
+
+@pytest.fixture(scope="session")
+def sample_valid(sample_parsed):
+    valid, _, _ = validate_and_filter(sample_parsed)
+    return valid
+
+
+@pytest.fixture(scope="session")
+def catalog():
+    with open(CATALOG_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def product_mapping(catalog):
+    return create_product_mapping(catalog)
+
+
+def synthetic_lines(sample_raw, size):
+    """
+    Builds `size` raw lines by cycling through the sample data with fresh
+    TransactionIDs, so every size has the same data mix
+    """
+    lines = []
+    for i in range(size):
+        fields = sample_raw[i % len(sample_raw)].split("|")
+        fields[0] = f"T{i + 1}"
+        lines.append("|".join(fields))
+    return lines
+
+
+@pytest.fixture(scope="session")
+def make_lines(sample_raw):
+    return lambda size: synthetic_lines(sample_raw, size)
+
+
+@pytest.fixture
+def make_tx():
+    """
+    Returns a factory for valid transactions with selected fields overridden
+    """
+    def make(**overrides):
+        tx = {
+            'TransactionID': 'T001',
+            'Date': '2024-12-01',
+            'ProductID': 'P101',
+            'ProductName': 'Laptop',
+            'Quantity': 1,
+            'UnitPrice': 100.0,
+            'CustomerID': 'C001',
+            'Region': 'North'
+        }
+        tx.update(overrides)
+        return tx
+    return make
+
+
+# ---------- performance baseline ----------
+
+def time_best(run, runs=5, min_seconds=0.5):
+    """
+    Best time of at least `runs` repeats and `min_seconds`, with the
+    garbage collector off as in timeit
+    """
+    best = None
+    total = 0.0
+    repeats = 0
+    gc.disable()
+    try:
+        while repeats < runs or total < min_seconds:
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+            total += elapsed
+            repeats += 1
+    finally:
+        gc.enable()
+    return best
+
+
+CALIBRATION_KEYS = [f"K{i % 50}" for i in range(20000)]
+
+
+def _calibration_workload():
+    totals = {}
+    for key in CALIBRATION_KEYS:
+        if key not in totals:
+            totals[key] = 0.0
+        totals[key] += 1.5
+    return totals
+
+
+def calibrate():
+    """
+    Times a fixed pure-Python workload (dict updates like the analytics do)
+    the same way the cases are timed, so the two can be compared
+
+    Returns: best time in seconds
+    """
+    return time_best(_calibration_workload)
+
+
+def peak_memory_kb(run):
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024, 1)
+
+
+class PerfBaseline:
+    """
+    Stored per-case results and the regression check against them
+
+    Throughput is stored relative to the calibration workload timed next
+    to it ('relative', thousands of rows per calibration run), so the
+    baseline survives changes in machine speed.
+    """
+
+    def __init__(self, path, tolerance, update):
+        self.path = path
+        self.tolerance = tolerance
+        self.update = update
+        self.measured = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.data = json.load(f)
+        except FileNotFoundError:
+            self.data = {}
+
+    def regression(self, result, base):
+        """
+        Returns: description of the regression, or None
+        """
+        if result["relative"] < base["relative"] * (1 - self.tolerance):
+            return (f"throughput {result['relative']:.4f} is more than "
+                    f"{self.tolerance:.0%} below baseline {base['relative']:.4f}")
+        if result["peak_kb"] > base["peak_kb"] * (1 + self.tolerance) + MEMORY_SLACK_KB:
+            return (f"peak memory {result['peak_kb']} KB is more than "
+                    f"{self.tolerance:.0%} above baseline {base['peak_kb']} KB")
+        return None
+
+    def check(self, name, size, result, remeasure):
+        """
+        Compares one case with the baseline, or records it when updating
+
+        A regressed case is measured once more with `remeasure` and the
+        better result is kept, so a single noisy measurement does not fail.
+        """
+        key = str(size)
+        if self.update:
+            passes = [result] + [remeasure() for _ in range(BASELINE_PASSES - 1)]
+            self.measured.setdefault(name, {})[key] = {
+                field: statistics.median(p[field] for p in passes) for field in result
+            }
+            return
+
+        base = self.data.get(name, {}).get(key)
+        if base is None:
+            warnings.warn(f"no performance baseline for {name} at {size} rows")
+            return
+
+        if self.regression(result, base):
+            again = remeasure()
+            result = {
+                "relative": max(result["relative"], again["relative"]),
+                "peak_kb": min(result["peak_kb"], again["peak_kb"])
+            }
+
+        problem = self.regression(result, base)
+        if problem:
+            pytest.fail(f"{name} at {size} rows: {problem}")
+
+    def save(self):
+        for name, by_size in self.measured.items():
+            self.data.setdefault(name, {}).update(by_size)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+
+@pytest.fixture(scope="session")
+def perf_baseline(request):
+    baseline = PerfBaseline(
+        PERF_BASELINE,
+        request.config.getoption("--perf-tolerance"),
+        request.config.getoption("--perf-update-baseline")
+    )
+    yield baseline
+    if baseline.update and baseline.measured:
+        baseline.save()
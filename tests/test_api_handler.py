@@ -0,0 +1,74 @@
+# tests/test_api_handler.py
+from utils.api_handler import create_product_mapping, enrich_sales_data, save_enriched_data
+from utils.product_matching import ProductMatcher
+
+from tests.conftest import GOLDEN_ENRICHED
+
+
+def test_create_product_mapping(catalog):
+    mapping = create_product_mapping(catalog)
+
+    assert sorted(mapping) == [1, 78, 83, 95, 96, 104]
+    assert mapping[104] == {
+        "title": "Samsung Curved Monitor",
+        "category": "monitors",
+        "brand": "Samsung",
+        "rating": 4.3
+    }
+
+
+def test_create_product_mapping_missing_fields():
+    assert create_product_mapping([{"id": 7}]) == {
+        7: {"title": None, "category": None, "brand": None, "rating": None}
+    }
+
+
+def test_enrich_by_id(make_tx, product_mapping):
+    tx = make_tx(ProductID="P104", ProductName="Anything")
+
+    enriched, = enrich_sales_data([tx], product_mapping, fuzzy=False)
+
+    assert enriched["API_Category"] == "monitors"
+    assert enriched["API_Brand"] == "Samsung"
+    assert enriched["API_Rating"] == 4.3
+    assert enriched["API_Match"] is True
+    assert "API_Match" not in tx
+
+
+def test_enrich_unmatched(make_tx, product_mapping):
+    enriched, = enrich_sales_data([make_tx(ProductID="Pxx", ProductName="USB Cable")], product_mapping)
+
+    assert enriched["API_Match"] is False
+    assert enriched["API_Category"] is None
+
+
+def test_enrich_by_name(make_tx, product_mapping):
+    transactions = [
+        make_tx(ProductID="P101", ProductName="Laptop"),
+        make_tx(ProductID="P102", ProductName="Mouse"),
+        make_tx(ProductID="P106", ProductName="Headphones"),
+    ]
+
+    enriched = enrich_sales_data(transactions, product_mapping)
+
+    assert [tx["API_Brand"] for tx in enriched] == ["Asus", "Logitech", "Sonic"]
+    assert not any(tx["API_Match"] for tx in enrich_sales_data(transactions, product_mapping, fuzzy=False))
+
+
+def test_enrich_reuses_matcher(make_tx, product_mapping):
+    matcher = ProductMatcher(product_mapping)
+
+    enrich_sales_data([make_tx(ProductID="P102", ProductName="Mouse")], product_mapping, matcher=matcher)
+
+    assert matcher.cache == {"Mouse": 95}
+
+
+def test_save_enriched_matches_golden(sample_valid, product_mapping, tmp_path, capsys):
+    # The golden file was written by the original code, which matched by id only
+    enriched = enrich_sales_data(sample_valid, product_mapping, fuzzy=False)
+    output = tmp_path / "enriched.txt"
+
+    save_enriched_data(enriched, str(output))
+
+    assert output.read_text(encoding="utf-8") == GOLDEN_ENRICHED.read_text(encoding="utf-8")
+    assert "saved" in capsys.readouterr().out
@@ -0,0 +1,105 @@
+# tests/test_data_processor.py
+import pytest
+
+from utils.api_handler import enrich_sales_data
+from utils.data_processor import (
+    calculate_total_revenue,
+    region_wise_sales,
+    top_selling_products,
+    customer_analysis,
+    daily_sales_trend,
+    find_peak_sales_day,
+    low_performing_products,
+    generate_sales_report
+)
+
+from tests.conftest import GOLDEN_REPORT
+
+
+@pytest.fixture
+def transactions(make_tx):
+    return [
+        make_tx(TransactionID="T1", Date="2024-12-01", ProductName="Laptop",
+                Quantity=1, UnitPrice=1000.0, CustomerID="C1", Region="North"),
+        make_tx(TransactionID="T2", Date="2024-12-01", ProductName="Mouse",
+                Quantity=4, UnitPrice=50.0, CustomerID="C2", Region="South"),
+        make_tx(TransactionID="T3", Date="2024-12-02", ProductName="Mouse",
+                Quantity=10, UnitPrice=50.0, CustomerID="C1", Region="North"),
+        make_tx(TransactionID="T4", Date="2024-12-03", ProductName="Cable",
+                Quantity=3, UnitPrice=100.0, CustomerID="C3", Region="East"),
+    ]
+
+
+def test_total_revenue(transactions):
+    assert calculate_total_revenue(transactions) == 2000.0
+    assert calculate_total_revenue([]) == 0.0
+
+
+def test_region_wise_sales(transactions):
+    result = region_wise_sales(transactions)
+
+    assert list(result) == ["North", "East", "South"]
+    assert result["North"] == {'total_sales': 1500.0, 'transaction_count': 2, 'percentage': 75.0}
+    assert result["East"] == {'total_sales': 300.0, 'transaction_count': 1, 'percentage': 15.0}
+    assert result["South"] == {'total_sales': 200.0, 'transaction_count': 1, 'percentage': 10.0}
+
+
+def test_top_selling_products(transactions):
+    assert top_selling_products(transactions, n=2) == [
+        ("Mouse", 14, 700.0),
+        ("Cable", 3, 300.0),
+    ]
+    assert len(top_selling_products(transactions, n=10)) == 3
+
+
+def test_customer_analysis(transactions):
+    result = customer_analysis(transactions)
+
+    assert list(result) == ["C1", "C3", "C2"]
+    assert result["C1"] == {
+        'total_spent': 1500.0,
+        'purchase_count': 2,
+        'avg_order_value': 750.0,
+        'products_bought': ["Laptop", "Mouse"]
+    }
+
+
+def test_daily_sales_trend(transactions):
+    assert daily_sales_trend(transactions) == {
+        "2024-12-01": {"revenue": 1200.0, "transaction_count": 2, "unique_customers": 2},
+        "2024-12-02": {"revenue": 500.0, "transaction_count": 1, "unique_customers": 1},
+        "2024-12-03": {"revenue": 300.0, "transaction_count": 1, "unique_customers": 1},
+    }
+
+
+def test_find_peak_sales_day(transactions):
+    assert find_peak_sales_day(transactions) == ("2024-12-01", 1200.0, 2)
+
+
+def test_low_performing_products(transactions):
+    assert low_performing_products(transactions) == [
+        ("Laptop", 1, 1000.0),
+        ("Cable", 3, 300.0),
+    ]
+    assert low_performing_products(transactions, threshold=1) == []
+
+
+def test_sample_figures(sample_valid):
+    assert round(calculate_total_revenue(sample_valid), 2) == 3540205.0
+    assert find_peak_sales_day(sample_valid) == ("2024-12-02", 882906.0, 5)
+
+
+def _without_timestamp(text):
+    return "".join(line for line in text.splitlines(keepends=True)
+                   if not line.startswith("Generated:"))
+
+
+def test_report_matches_golden(sample_valid, product_mapping, tmp_path):
+    # The golden report was written by the original code, which matched by id only
+    enriched = enrich_sales_data(sample_valid, product_mapping, fuzzy=False)
+    output = tmp_path / "sales_report.txt"
+
+    generate_sales_report(sample_valid, enriched, str(output))
+
+    assert _without_timestamp(output.read_text(encoding="utf-8")) == \
+        GOLDEN_REPORT.read_text(encoding="utf-8")
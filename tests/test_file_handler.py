@@ -0,0 +1,158 @@
+# tests/test_file_handler.py
+import gzip
+
+from utils.file_handler import (
+    read_sales_data,
+    parse_transactions,
+    is_valid_transaction,
+    validate_and_filter
+)
+
+HEADER = "TransactionID|Date|ProductID|ProductName|Quantity|UnitPrice|CustomerID|Region\n"
+
+
+# ---------- read_sales_data ----------
+
+def test_read_skips_header_and_empty_lines(tmp_path):
+    path = tmp_path / "sales.txt"
+    path.write_text(HEADER + "T001|2024-12-01|P101|Laptop|2|45000|C001|North\n\n  \n"
+                    "T002|2024-12-02|P102|Mouse|1|500|C002|South\n", encoding="utf-8")
+
+    assert read_sales_data(str(path)) == [
+        "T001|2024-12-01|P101|Laptop|2|45000|C001|North",
+        "T002|2024-12-02|P102|Mouse|1|500|C002|South",
+    ]
+
+
+def test_read_falls_back_to_latin1(tmp_path):
+    path = tmp_path / "sales.txt"
+    path.write_bytes((HEADER + "T001|2024-12-01|P101|Caf\xe9 Mug|1|10|C001|North\n").encode("latin-1"))
+
+    assert read_sales_data(str(path)) == ["T001|2024-12-01|P101|Café Mug|1|10|C001|North"]
+
+
+def test_read_gzip(tmp_path):
+    path = tmp_path / "sales.txt.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(HEADER + "T001|2024-12-01|P101|Laptop|2|45000|C001|North\n")
+
+    assert read_sales_data(str(path)) == ["T001|2024-12-01|P101|Laptop|2|45000|C001|North"]
+
+
+def test_read_missing_file(tmp_path, capsys):
+    assert read_sales_data(str(tmp_path / "missing.txt")) == []
+    assert "not found" in capsys.readouterr().out
+
+
+def test_read_sample(sample_raw):
+    assert len(sample_raw) == 80
+    assert sample_raw[0] == "T018|2024-12-29|P107|USB Cable|8|173|C009|South"
+
+
+# ---------- parse_transactions ----------
+
+def test_parse_converts_types():
+    assert parse_transactions(["T001|2024-12-01|P101|Laptop|2|45000|C001|North"]) == [{
+        'TransactionID': 'T001',
+        'Date': '2024-12-01',
+        'ProductID': 'P101',
+        'ProductName': 'Laptop',
+        'Quantity': 2,
+        'UnitPrice': 45000.0,
+        'CustomerID': 'C001',
+        'Region': 'North'
+    }]
+
+
+def test_parse_removes_commas_from_numbers_and_names():
+    tx, = parse_transactions(["T063|2024-12-07|P110|Laptop Charger,65W|1,200|1,916.50|C022|East"])
+
+    assert tx['ProductName'] == "Laptop Charger65W"
+    assert tx['Quantity'] == 1200
+    assert tx['UnitPrice'] == 1916.5
+
+
+def test_parse_skips_wrong_field_count():
+    assert parse_transactions([
+        "T001|2024-12-01|P101|Laptop|2|45000|C001",
+        "T001|2024-12-01|P101|Laptop|2|45000|C001|North|extra",
+        "",
+    ]) == []
+
+
+def test_parse_skips_non_numeric_values():
+    assert parse_transactions([
+        "T001|2024-12-01|P101|Laptop|two|45000|C001|North",
+        "T002|2024-12-01|P101|Laptop|2|abc|C001|North",
+        "T003|2024-12-01|P101|Laptop|2.5|100|C001|North",
+    ]) == []
+
+
+def test_parse_keeps_rows_that_fail_validation():
+    # Validation is validate_and_filter's job
+    tx, = parse_transactions(["X001|2024-12-01|P101|Laptop|0|-5|C001|"])
+    assert tx['Quantity'] == 0 and tx['UnitPrice'] == -5.0 and tx['Region'] == ""
+
+
+def test_parse_sample(sample_parsed):
+    assert len(sample_parsed) == 80
+    assert all(isinstance(tx['Quantity'], int) for tx in sample_parsed)
+    assert all(isinstance(tx['UnitPrice'], float) for tx in sample_parsed)
+
+
+# ---------- validation ----------
+
+def test_is_valid_transaction(make_tx):
+    assert is_valid_transaction(make_tx())
+    assert not is_valid_transaction(make_tx(Quantity=0))
+    assert not is_valid_transaction(make_tx(UnitPrice=0.0))
+    assert not is_valid_transaction(make_tx(TransactionID="X001"))
+    assert not is_valid_transaction(make_tx(ProductID="Q101"))
+    assert not is_valid_transaction(make_tx(CustomerID=""))
+
+
+def test_validate_counts_invalid(make_tx):
+    transactions = [
+        make_tx(),
+        make_tx(TransactionID="T002", Quantity=-1),
+        make_tx(TransactionID="T003", CustomerID="X9"),
+    ]
+
+    valid, invalid, summary = validate_and_filter(transactions)
+
+    assert valid == [transactions[0]]
+    assert invalid == 2
+    assert summary == {
+        'total_input': 3,
+        'invalid': 2,
+        'filtered_by_region': 0,
+        'filtered_by_amount': 0,
+        'final_count': 1
+    }
+
+
+def test_validate_filters_by_region_and_amount(make_tx):
+    transactions = [
+        make_tx(TransactionID="T001", Region="North", Quantity=1, UnitPrice=50.0),
+        make_tx(TransactionID="T002", Region="North", Quantity=2, UnitPrice=100.0),
+        make_tx(TransactionID="T003", Region="North", Quantity=10, UnitPrice=100.0),
+        make_tx(TransactionID="T004", Region="South", Quantity=2, UnitPrice=100.0),
+    ]
+
+    valid, invalid, summary = validate_and_filter(
+        transactions, region="North", min_amount=100, max_amount=500
+    )
+
+    assert [tx['TransactionID'] for tx in valid] == ["T002"]
+    assert invalid == 0
+    assert summary['filtered_by_region'] == 1
+    assert summary['filtered_by_amount'] == 2
+    assert summary['final_count'] == 1
+
+
+def test_validate_sample(sample_parsed, sample_valid):
+    _, invalid, summary = validate_and_filter(sample_parsed)
+
+    assert len(sample_valid) == 71
+    assert invalid == 9
+    assert summary['final_count'] == 71
@@ -0,0 +1,107 @@
+# tests/test_ingestion.py
+import gzip
+import shutil
+
+import pytest
+
+from utils.api_handler import enrich_sales_data, save_enriched_data
+from utils.file_handler import parse_transactions
+from utils.ingestion import TransactionIdSet, resolve_sources, read_sales_sources
+
+from tests.conftest import SAMPLE_FILE
+
+HEADER = "TransactionID|Date|ProductID|ProductName|Quantity|UnitPrice|CustomerID|Region\n"
+
+
+def write_sales(path, lines, compress=False):
+    text = HEADER + "".join(line + "\n" for line in lines)
+    if compress:
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_transaction_id_set():
+    seen = TransactionIdSet()
+
+    assert seen.add("T001")
+    assert seen.add("T1")  # different string from T001
+    assert seen.add("ABC")
+    assert not seen.add("T001")
+    assert not seen.add("T1")
+    assert not seen.add("ABC")
+    assert len(seen) == 3
+
+
+def test_resolve_sources(tmp_path):
+    row = "T1|2024-12-01|P101|Laptop|1|100|C1|North"
+    for name in ["b.txt", "a.txt"]:
+        write_sales(tmp_path / name, [row])
+    write_sales(tmp_path / "c.txt.gz", [row], compress=True)
+    (tmp_path / "notes.md").write_text("")
+
+    expected = [str(tmp_path / n) for n in ["a.txt", "b.txt", "c.txt.gz"]]
+    assert resolve_sources(str(tmp_path)) == expected
+    assert resolve_sources(str(tmp_path / "*.txt")) == expected[:2]
+    assert resolve_sources([str(tmp_path / "b.txt"), str(tmp_path / "b.txt")]) == expected[1:2]
+
+
+def test_directory_skips_enriched_output(tmp_path, sample_valid, product_mapping, capsys):
+    shutil.copy(SAMPLE_FILE, tmp_path / "sales_data.txt")
+    enriched = enrich_sales_data(sample_valid, product_mapping)
+    save_enriched_data(enriched, str(tmp_path / "enriched_sales_data.txt"))
+    (tmp_path / "notes.txt").write_text("not sales data\n")
+
+    transactions, summary = read_sales_sources(str(tmp_path))
+
+    assert resolve_sources(str(tmp_path / "*.txt")) == [str(tmp_path / "sales_data.txt")]
+    assert summary == {'files': 1, 'raw_lines': 80, 'parsed': 80, 'duplicates': 0}
+    # Files named directly are always read
+    assert len(resolve_sources([str(tmp_path / "notes.txt")])) == 1
+
+
+def test_single_file_matches_file_handler(sample_parsed):
+    transactions, summary = read_sales_sources(str(SAMPLE_FILE))
+
+    assert transactions == sample_parsed
+    assert summary == {'files': 1, 'raw_lines': 80, 'parsed': 80, 'duplicates': 0}
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_merges_in_order_and_drops_duplicates(tmp_path, use_processes):
+    write_sales(tmp_path / "a.txt", [
+        "T1|2024-12-01|P101|Laptop|1|100|C1|North",
+        "T2|2024-12-01|P102|Mouse|1|10|C2|South",
+    ])
+    write_sales(tmp_path / "b.txt.gz", [
+        "T2|2024-12-05|P102|Mouse|9|10|C2|South",
+        "T3|2024-12-02|P103|Keyboard|bad|10|C3|East",
+        "T4|2024-12-02|P103|Keyboard|1|10|C3|East",
+    ], compress=True)
+
+    transactions, summary = read_sales_sources(
+        str(tmp_path), max_workers=2, use_processes=use_processes
+    )
+
+    assert [tx['TransactionID'] for tx in transactions] == ["T1", "T2", "T4"]
+    assert transactions[1]['Quantity'] == 1
+    assert summary == {'files': 2, 'raw_lines': 5, 'parsed': 3, 'duplicates': 1}
+
+
+def test_no_files(tmp_path):
+    assert read_sales_sources(str(tmp_path)) == ([], {
+        'files': 0, 'raw_lines': 0, 'parsed': 0, 'duplicates': 0
+    })
+
+
+def test_many_files_match_one_file(tmp_path, make_lines):
+    lines = make_lines(3000)
+    for i in range(0, len(lines), 500):
+        write_sales(tmp_path / f"part{i // 500}.txt", lines[i:i + 500])
+
+    transactions, summary = read_sales_sources(str(tmp_path / "part*.txt"), max_workers=4)
+
+    assert transactions == parse_transactions(lines)
+    assert summary['files'] == 6
@@ -0,0 +1,156 @@
+# tests/test_out_of_core.py
+import builtins
+
+import pytest
+
+from utils.file_handler import parse_transactions, validate_and_filter
+from utils.data_processor import (
+    calculate_total_revenue,
+    region_wise_sales,
+    top_selling_products,
+    customer_analysis,
+    daily_sales_trend,
+    find_peak_sales_day,
+    low_performing_products
+)
+from utils.out_of_core import (
+    SpillWriter,
+    iter_sales_file,
+    out_of_core_analysis,
+    write_out_of_core_report,
+    main
+)
+
+from tests.conftest import SAMPLE_FILE
+
+
+def in_memory(transactions, top_customers):
+    customers = customer_analysis(transactions)
+    return {
+        'total_revenue': calculate_total_revenue(transactions),
+        'region_wise_sales': region_wise_sales(transactions),
+        'top_selling_products': top_selling_products(transactions, n=5),
+        'customer_analysis': dict(list(customers.items())[:top_customers]),
+        'daily_sales_trend': daily_sales_trend(transactions),
+        'peak_sales_day': find_peak_sales_day(transactions),
+        'low_performing_products': low_performing_products(transactions)
+    }
+
+
+def test_iter_sales_file_matches_file_handler(sample_valid):
+    assert list(iter_sales_file(str(SAMPLE_FILE))) == sample_valid
+
+
+def test_iter_sales_file_filters(sample_parsed):
+    expected, _, _ = validate_and_filter(sample_parsed, region="North", min_amount=1000)
+    assert list(iter_sales_file(str(SAMPLE_FILE), region="North", min_amount=1000)) == expected
+
+
+def test_iter_sales_file_missing(tmp_path, capsys):
+    assert list(iter_sales_file(str(tmp_path / "missing.txt"))) == []
+    assert "not found" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("num_partitions", [1, 7, 64])
+def test_sample_parity(sample_valid, tmp_path, num_partitions):
+    results = out_of_core_analysis(
+        iter(sample_valid), top_customers=10,
+        num_partitions=num_partitions, spill_dir=str(tmp_path)
+    )
+    assert results == in_memory(sample_valid, 10)
+
+
+@pytest.mark.parametrize("num_partitions", [3, 300])
+def test_synthetic_parity(make_lines, num_partitions):
+    # Large enough to repeat every product/customer/day many times and to
+    # need more spill files than MAX_OPEN_SPILL_FILES at 300 partitions
+    valid, _, _ = validate_and_filter(parse_transactions(make_lines(20000)))
+
+    results = out_of_core_analysis(valid, top_customers=3, num_partitions=num_partitions)
+
+    assert results == in_memory(valid, 3)
+
+
+def test_empty_input(tmp_path):
+    results = out_of_core_analysis([], spill_dir=str(tmp_path), num_partitions=4)
+
+    assert results['total_revenue'] == 0.0
+    assert results['customer_analysis'] == {}
+    assert results['peak_sales_day'] is None
+
+
+@pytest.mark.parametrize("kwargs", [
+    {'top_customers': None}, {'top_customers': 0}, {'top_n': -1}, {'top_n': 2.5},
+    {'num_partitions': 0}, {'num_partitions': -3}, {'num_partitions': None},
+])
+def test_rejects_unbounded_top_k(kwargs):
+    with pytest.raises(ValueError):
+        out_of_core_analysis([], **kwargs)
+
+
+def test_spill_writer_bounds_open_files(tmp_path):
+    writer = SpillWriter(max_open=2, buffer_rows=1)
+    paths = [str(tmp_path / f"p{i}.txt") for i in range(4)]
+
+    for round_ in range(3):
+        for path in paths:
+            writer.write(path, f"{round_}\n")
+            assert len(writer.files) <= 2
+
+    assert writer.close() == set(paths)
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            assert f.read() == "0\n1\n2\n"
+
+
+def test_spill_writer_batches_reopens(tmp_path, monkeypatch):
+    opened = []
+    real_open = builtins.open
+
+    def counting_open(path, *args, **kwargs):
+        opened.append(path)
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", counting_open)
+    writer = SpillWriter(max_open=2, buffer_rows=40)
+    paths = [str(tmp_path / f"p{i}.txt") for i in range(4)]
+
+    for i in range(80):
+        writer.write(paths[i % 4], f"{i}\n")
+    writer.close()
+    monkeypatch.setattr(builtins, "open", real_open)
+
+    # Two flushes of four files each, instead of a reopen on every write
+    assert len(opened) == 8
+    with open(paths[1], encoding="utf-8") as f:
+        assert f.read() == "".join(f"{i}\n" for i in range(1, 80, 4))
+
+
+def test_entry_point_rejects_bad_partitions(capsys):
+    with pytest.raises(SystemExit) as exc:
+        main([str(SAMPLE_FILE), "--partitions", "0"])
+
+    assert exc.value.code == 2
+    assert "num_partitions" in capsys.readouterr().err
+
+
+def test_report_and_entry_point(tmp_path, capsys):
+    output = tmp_path / "report.txt"
+
+    assert main([str(SAMPLE_FILE), "--partitions", "4", "--top-customers", "3",
+                 "--spill-dir", str(tmp_path), "--output", str(output)]) == 0
+
+    report = output.read_text(encoding="utf-8")
+    assert "Records Processed: 71" in report
+    assert "Total Revenue: ₹3,540,205.00" in report
+    assert "TOP 3 CUSTOMERS" in report
+    assert "Best Selling Day: 2024-12-02" in report
+    assert "generated" in capsys.readouterr().out
+
+
+def test_report_without_rows(tmp_path):
+    output = tmp_path / "report.txt"
+
+    write_out_of_core_report(out_of_core_analysis([], spill_dir=str(tmp_path)), str(output))
+
+    assert "Records Processed: 0" in output.read_text(encoding="utf-8")
@@ -0,0 +1,86 @@
+# tests/test_performance.py
+import functools
+import tempfile
+
+import pytest
+
+from utils.file_handler import parse_transactions, validate_and_filter
+from utils.data_processor import (
+    calculate_total_revenue,
+    region_wise_sales,
+    top_selling_products,
+    customer_analysis,
+    daily_sales_trend,
+    find_peak_sales_day,
+    low_performing_products
+)
+from utils.api_handler import enrich_sales_data
+from utils.out_of_core import out_of_core_analysis
+from utils.windowed_analytics import rolling_sales_analysis
+
+from tests.conftest import calibrate, peak_memory_kb, time_best
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.perf
+
+SIZES = [1000, 10000, 50000]
+
+
+def _out_of_core(valid):
+    with tempfile.TemporaryDirectory() as spill_dir:
+        return out_of_core_analysis(valid, num_partitions=16, spill_dir=spill_dir)
+
+
+# name -> function(lines, valid transactions, product mapping)
+CASES = {
+    "parse_transactions": lambda lines, valid, mapping: parse_transactions(lines),
+    "validate_and_filter": lambda lines, valid, mapping: validate_and_filter(valid),
+    "calculate_total_revenue": lambda lines, valid, mapping: calculate_total_revenue(valid),
+    "region_wise_sales": lambda lines, valid, mapping: region_wise_sales(valid),
+    "top_selling_products": lambda lines, valid, mapping: top_selling_products(valid),
+    "customer_analysis": lambda lines, valid, mapping: customer_analysis(valid),
+    "daily_sales_trend": lambda lines, valid, mapping: daily_sales_trend(valid),
+    "find_peak_sales_day": lambda lines, valid, mapping: find_peak_sales_day(valid),
+    "low_performing_products": lambda lines, valid, mapping: low_performing_products(valid),
+    "enrich_sales_data": lambda lines, valid, mapping: enrich_sales_data(valid, mapping),
+    "out_of_core_analysis": lambda lines, valid, mapping: _out_of_core(valid),
+    "rolling_sales_analysis": lambda lines, valid, mapping: rolling_sales_analysis(valid),
+}
+
+
+@pytest.fixture(scope="module")
+def dataset(make_lines):
+    @functools.lru_cache(maxsize=None)
+    def build(size):
+        lines = make_lines(size)
+        valid, _, _ = validate_and_filter(parse_transactions(lines))
+        return lines, valid
+    return build
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("name", list(CASES))
+def test_throughput_and_memory(benchmark, perf_baseline, dataset, product_mapping,
+                               capsys, name, size):
+    lines, valid = dataset(size)
+    case = CASES[name]
+
+    def run():
+        return case(lines, valid, product_mapping)
+
+    def measure():
+        # Timed like the calibration workload; pytest-benchmark's own
+        # statistics use many more rounds and are only reported
+        result = {
+            "relative": round(calibrate() / time_best(run) * size / 1000, 4),
+            "peak_kb": peak_memory_kb(run)
+        }
+        # validate_and_filter prints its summary on every call
+        capsys.readouterr()
+        return result
+
+    benchmark.group = name
+    benchmark(run)
+
+    perf_baseline.check(name, size, measure(), remeasure=measure)
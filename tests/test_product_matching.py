@@ -0,0 +1,61 @@
+# tests/test_product_matching.py
+import pytest
+
+from utils.product_matching import ProductMatcher, normalize_title, title_trigrams
+
+
+@pytest.fixture
+def matcher(product_mapping):
+    return ProductMatcher(product_mapping)
+
+
+def test_normalize_title():
+    assert normalize_title("MouseWireless") == "mouse wireless"
+    assert normalize_title("  USB-Cable, 2m ") == "usb cable 2m"
+    assert normalize_title(None) == ""
+
+
+def test_title_trigrams():
+    assert title_trigrams("ab cd") == {" ab", "ab ", " cd", "cd "}
+    assert title_trigrams("") == set()
+
+
+@pytest.mark.parametrize("name, pid", [
+    ("Samsung Curved Monitor", 104),
+    ("samsung curved-monitor", 104),
+    ("Laptop", 83),
+    ("Mouse", 95),
+    ("MouseWireless", 95),
+    ("Wireles Mouse", 95),
+    ("Headphones", 96),
+    ("Headphone", 96),
+    ("Monitor", 104),
+])
+def test_matches(matcher, name, pid):
+    assert matcher.match(name) == pid
+
+
+@pytest.mark.parametrize("name", [
+    "Pro", "Screen", "Dual", "Apple", "USB Cable", "Laptop Charger",
+    "LaptopPremium", "Webcam", "", None,
+])
+def test_rejects_generic_or_unknown_names(matcher, name):
+    assert matcher.match(name) is None
+
+
+def test_memoizes_misses(matcher):
+    assert matcher.match("Webcam") is None
+    assert "Webcam" in matcher.cache
+
+
+def test_lowest_id_wins_on_tie():
+    mapping = {
+        9: {"title": "Wireless Mouse"},
+        3: {"title": "Wireless Mouse"},
+    }
+    assert ProductMatcher(mapping).match("Wireless Mouse") == 3
+
+
+def test_skips_products_without_title():
+    matcher = ProductMatcher({1: {"title": None}, 2: {"title": "Mouse"}})
+    assert matcher.match("Mouse") == 2
@@ -0,0 +1,286 @@
+# tests/test_service.py
+import builtins
+import json
+import os
+import shutil
+import stat
+import threading
+import urllib.request
+
+import pytest
+
+import utils.api_handler
+import utils.service
+from utils.data_processor import (
+    calculate_total_revenue,
+    region_wise_sales,
+    customer_analysis,
+    daily_sales_trend
+)
+from utils.file_handler import read_sales_data, parse_transactions, validate_and_filter
+from utils.service import (
+    CACHE_MAX_ENTRIES,
+    MAX_ROLLING_WINDOWS,
+    AnalyticsState,
+    LRUCache,
+    create_server,
+    handle_query
+)
+
+from tests.conftest import SAMPLE_FILE
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "sales_data.txt"
+    shutil.copy(SAMPLE_FILE, path)
+    return path
+
+
+@pytest.fixture
+def state(data_file):
+    return AnalyticsState(str(data_file), use_api=False)
+
+
+def touch_later(path):
+    # Guarantees a new mtime even on filesystems with coarse timestamps
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+
+
+def revenue(state):
+    return handle_query(state, "/revenue", {})[1]["total_revenue"]
+
+
+def test_lru_cache():
+    cache = LRUCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_queries_match_data_processor(state, sample_valid, sample_parsed):
+    north, _, _ = validate_and_filter(sample_parsed, region="North", min_amount=5000)
+
+    assert revenue(state) == calculate_total_revenue(sample_valid)
+    assert handle_query(state, "/regions", {}) == (200, region_wise_sales(sample_valid))
+    assert handle_query(state, "/daily", {}) == (200, daily_sales_trend(sample_valid))
+    assert handle_query(state, "/customers", {"limit": "3"})[1] == \
+        dict(list(customer_analysis(sample_valid).items())[:3])
+    assert handle_query(state, "/transactions", {"region": "North", "min_amount": "5000"}) == \
+        (200, north)
+
+
+def test_health(state):
+    status, payload = handle_query(state, "/health", {})
+
+    assert status == 200
+    assert payload["version"] == 1
+    assert payload["transactions"] == 71
+    assert payload["invalid"] == 9
+
+
+def test_bad_requests(state):
+    assert handle_query(state, "/nope", {})[0] == 404
+    assert handle_query(state, "/revenue", {"foo": "1"})[0] == 400
+    assert handle_query(state, "/top-products", {"n": "x"})[0] == 400
+    assert handle_query(state, "/peak", {"region": "Nowhere"}) == (200, None)
+
+
+@pytest.mark.parametrize("path, params", [
+    ("/top-products", {"n": "-1"}),
+    ("/customers", {"limit": "-2"}),
+    ("/transactions", {"limit": "-5"}),
+])
+def test_negative_counts_are_rejected(state, path, params):
+    assert handle_query(state, path, params)[0] == 400
+
+
+def test_zero_counts(state):
+    assert handle_query(state, "/transactions", {"limit": "0"}) == (200, [])
+    assert handle_query(state, "/top-products", {"n": "0"}) == (200, [])
+
+
+def test_rolling_limits(state):
+    assert handle_query(state, "/rolling", {"windows": "0"})[0] == 400
+    too_many = ",".join(["7"] * (MAX_ROLLING_WINDOWS + 1))
+    assert handle_query(state, "/rolling", {"windows": too_many})[0] == 400
+
+    status, payload = handle_query(state, "/rolling", {"windows": "100000000"})
+    assert status == 200
+    assert payload["skipped_rows"] == 0
+
+
+def test_failed_catalog_fetch_is_retried(data_file, monkeypatch):
+    responses = [[], [{"id": 104, "title": "Samsung Curved Monitor", "category": "monitors"}]]
+    monkeypatch.setattr(utils.api_handler, "fetch_all_products", lambda: responses.pop(0))
+    clock = [1000.0]
+    monkeypatch.setattr(utils.service.time, "monotonic", lambda: clock[0])
+    state = AnalyticsState(str(data_file))
+
+    assert handle_query(state, "/enrichment", {})[1]["enriched"] == 0
+    assert handle_query(state, "/enrichment", {})[1]["enriched"] == 0
+
+    clock[0] += utils.service.CATALOG_RETRY_SECONDS
+    assert handle_query(state, "/enrichment", {})[1]["enriched"] == 7
+    assert responses == []
+
+    clock[0] += utils.service.CATALOG_RETRY_SECONDS
+    assert handle_query(state, "/enrichment", {})[1]["enriched"] == 7
+
+
+def test_enrichment_without_api(state):
+    status, payload = handle_query(state, "/enrichment", {})
+
+    assert status == 200
+    assert payload["enriched"] == 0
+    assert state.product_matcher() is state.product_matcher()
+
+
+def test_cache_is_bounded(state):
+    for i in range(CACHE_MAX_ENTRIES + 50):
+        handle_query(state, "/revenue", {"min_amount": str(i)})
+
+    assert len(state.snapshot.cache) == CACHE_MAX_ENTRIES
+
+
+def test_append_is_loaded_incrementally(state, data_file):
+    before = revenue(state)
+    with open(data_file, "a", encoding="utf-8") as f:
+        f.write("T900|2024-12-31|P101|Laptop|1|1000|C001|North\n")
+
+    assert revenue(state) == before + 1000
+    assert state.snapshot.version == 2
+    assert state.snapshot.by_region["North"][-1]["TransactionID"] == "T900"
+
+
+def test_partial_row_is_replaced_when_completed(state, data_file):
+    before = revenue(state)
+    with open(data_file, "a", encoding="utf-8") as f:
+        f.write("T900|2024-12-31|P101|Laptop|1|1000|C001|Nor")
+
+    assert revenue(state) == before + 1000
+    assert state.snapshot.transactions[-1]["Region"] == "Nor"
+
+    with open(data_file, "a", encoding="utf-8") as f:
+        f.write("th\nT901|2024-12-31|P101|Laptop|1|500|C001|South\n")
+
+    assert revenue(state) == before + 1500
+    assert [tx["TransactionID"] for tx in state.snapshot.transactions[-2:]] == ["T900", "T901"]
+    assert "Nor" not in state.snapshot.by_region
+    assert state.snapshot.by_region["North"][-1]["TransactionID"] == "T900"
+
+
+def test_file_without_trailing_newline_matches_cli(tmp_path):
+    path = tmp_path / "sales.txt"
+    path.write_text(
+        "TransactionID|Date|ProductID|ProductName|Quantity|UnitPrice|CustomerID|Region\n"
+        "T1|2024-12-01|P101|Laptop|1|1000|C1|North\n"
+        "T2|2024-12-01|P102|Mouse|1|500|C2|South", encoding="utf-8"
+    )
+    expected, _, _ = validate_and_filter(parse_transactions(read_sales_data(str(path))))
+
+    state = AnalyticsState(str(path), use_api=False)
+
+    assert revenue(state) == calculate_total_revenue(expected) == 1500.0
+    assert state.snapshot.transactions == expected
+
+
+def test_header_only_file(tmp_path):
+    path = tmp_path / "sales.txt"
+    path.write_text("TransactionID|Date|ProductID|ProductName|Quantity|UnitPrice|CustomerID|Region",
+                    encoding="utf-8")
+
+    assert revenue(AnalyticsState(str(path), use_api=False)) == 0.0
+
+
+def test_same_size_edit_triggers_full_reload(state, data_file):
+    before = revenue(state)
+    content = data_file.read_bytes()
+    # Same length, different quantity on the first data row
+    edited = content.replace(b"|P107|USB Cable|8|173|", b"|P107|USB Cable|9|173|", 1)
+    assert len(edited) == len(content) and edited != content
+
+    data_file.write_bytes(edited)
+    touch_later(data_file)
+
+    assert revenue(state) == before + 173
+    assert len(state.snapshot.transactions) == 71
+
+
+def test_unreadable_file_keeps_snapshot(state, data_file, monkeypatch):
+    before = revenue(state)
+    with open(data_file, "a", encoding="utf-8") as f:
+        f.write("T900|2024-12-31|P101|Laptop|1|1000|C001|North\n")
+
+    real_open = builtins.open
+
+    def deny(path, *args, **kwargs):
+        if str(path) == str(data_file):
+            raise PermissionError("denied")
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", deny)
+    assert handle_query(state, "/revenue", {}) == (200, {"total_revenue": before})
+
+    monkeypatch.setattr(builtins, "open", real_open)
+    assert revenue(state) == before + 1000
+
+
+def test_removed_file_keeps_snapshot(state, data_file):
+    before = revenue(state)
+    data_file.unlink()
+
+    assert revenue(state) == before
+
+
+def test_replaced_file_triggers_full_reload(state, data_file, tmp_path):
+    replacement = tmp_path / "new.txt"
+    replacement.write_text(
+        "TransactionID|Date|ProductID|ProductName|Quantity|UnitPrice|CustomerID|Region\n"
+        "T1|2024-12-01|P101|Laptop|2|500|C1|North\n", encoding="utf-8"
+    )
+    os.replace(replacement, data_file)
+
+    assert revenue(state) == 1000.0
+    assert list(state.snapshot.by_region) == ["North"]
+
+
+def test_http_server(state):
+    server = create_server(state, port=0, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/peak?region=North"
+        with urllib.request.urlopen(url) as response:
+            payload = json.load(response)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert payload == handle_query(state, "/peak", {"region": "North"})[1]
+
+
+def test_unix_socket_replaces_only_stale_sockets(state, tmp_path):
+    path = tmp_path / "sales.sock"
+
+    server = create_server(state, socket_path=str(path), quiet=True)
+    server.server_close()
+    assert stat.S_ISSOCK(os.stat(path).st_mode)
+
+    # The stale socket left behind is replaced
+    create_server(state, socket_path=str(path), quiet=True).server_close()
+
+
+def test_unix_socket_refuses_regular_file(state, data_file):
+    content = data_file.read_bytes()
+
+    with pytest.raises(FileExistsError):
+        create_server(state, socket_path=str(data_file), quiet=True)
+
+    assert data_file.read_bytes() == content
@@ -0,0 +1,18 @@
+# tests/test_startup.py
+import pytest
+
+from utils.benchmark import DEFERRED_MODULES, STARTUP_MODULES, check_startup, measure_import_time
+
+
+@pytest.mark.parametrize("module", STARTUP_MODULES)
+def test_startup_does_not_import_deferred_modules(module):
+    loaded = measure_import_time(module, runs=1)["loaded"]
+
+    assert [m for m in DEFERRED_MODULES if m in loaded] == []
+
+
+@pytest.mark.perf
+def test_startup_import_budget():
+    passed, lines = check_startup()
+
+    assert passed, "\n".join(lines)
@@ -0,0 +1,127 @@
+# tests/test_windowed_analytics.py
+import statistics
+import tracemalloc
+from datetime import date, timedelta
+
+import pytest
+
+from utils.data_processor import daily_sales_trend
+from utils.windowed_analytics import RollingWindow, RunningStats, rolling_sales_analysis
+
+
+def test_rolling_window():
+    window = RollingWindow(3)
+    for value in [1.0, 2.0, 3.0, 4.0]:
+        window.push(value)
+
+    assert window.total == 9.0
+    assert window.count == 3
+
+
+def test_running_stats_matches_statistics():
+    values = [5.0, 1.5, 8.25, 3.0, 3.0, 10.0, 0.5]
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+
+    assert stats.mean == pytest.approx(statistics.mean(values))
+    assert stats.std() == pytest.approx(statistics.stdev(values))
+    assert stats.z_score(12.0) == pytest.approx(
+        (12.0 - statistics.mean(values)) / statistics.stdev(values)
+    )
+
+
+def test_running_stats_without_spread():
+    stats = RunningStats()
+    stats.add(4.0)
+    stats.add(4.0)
+
+    assert stats.std() == 0.0
+    assert stats.z_score(100.0) is None
+
+
+def test_daily_matches_daily_sales_trend(sample_valid):
+    assert rolling_sales_analysis(sample_valid)['daily'] == daily_sales_trend(sample_valid)
+
+
+def test_rolling_sums_match_brute_force(sample_valid):
+    result = rolling_sales_analysis(sample_valid, windows=(3, 7))
+    overall = result['overall']
+
+    revenue = {}
+    for tx in sample_valid:
+        revenue[tx['Date']] = revenue.get(tx['Date'], 0.0) + tx['Quantity'] * tx['UnitPrice']
+
+    first = date.fromisoformat(min(revenue))
+    last = date.fromisoformat(max(revenue))
+    days = [(first + timedelta(days=i)).isoformat() for i in range((last - first).days + 1)]
+    assert list(overall) == days
+
+    for i, day in enumerate(days):
+        for w in (3, 7):
+            expected = sum(revenue.get(d, 0.0) for d in days[max(0, i - w + 1):i + 1])
+            assert overall[day][f'rolling_{w}d'] == pytest.approx(expected)
+
+
+def test_growth_and_anomaly(make_tx):
+    transactions = [
+        make_tx(Date=f"2024-12-{d:02d}", Quantity=1, UnitPrice=price)
+        for d, price in enumerate([100.0, 110.0, 90.0, 105.0, 95.0, 1000.0], 1)
+    ]
+
+    overall = rolling_sales_analysis(transactions, min_history=5)['overall']
+
+    assert overall['2024-12-01']['growth_pct'] is None
+    assert overall['2024-12-02']['growth_pct'] == 10.0
+    assert overall['2024-12-05']['z_score'] is None
+    assert overall['2024-12-06']['anomaly'] is True
+    assert not any(entry['anomaly'] for day, entry in overall.items() if day != '2024-12-06')
+
+
+def test_fills_days_without_sales(make_tx):
+    transactions = [
+        make_tx(Date="2024-12-01", UnitPrice=10.0, Region="North"),
+        make_tx(Date="2024-12-04", UnitPrice=20.0, Region="South"),
+    ]
+
+    result = rolling_sales_analysis(transactions, windows=(2,))
+
+    assert [e['revenue'] for e in result['overall'].values()] == [10.0, 0.0, 0.0, 20.0]
+    assert result['by_region']['North']['2024-12-02']['rolling_2d'] == 10.0
+    assert list(result['by_region']['South']) == list(result['overall'])
+
+
+def test_skips_non_iso_dates(make_tx):
+    transactions = [
+        make_tx(Date="2024-12-01", UnitPrice=10.0),
+        make_tx(Date="01/12/2024", UnitPrice=20.0),
+        make_tx(Date="", UnitPrice=30.0),
+    ]
+
+    result = rolling_sales_analysis(transactions)
+
+    assert result['skipped_rows'] == 2
+    assert list(result['overall']) == ["2024-12-01"]
+    assert result['daily'] == daily_sales_trend(transactions)
+
+
+def test_only_invalid_dates(make_tx):
+    result = rolling_sales_analysis([make_tx(Date="n/a")])
+
+    assert result['overall'] == {}
+    assert result['skipped_rows'] == 1
+
+
+def test_huge_window_is_capped_at_the_calendar(sample_valid):
+    tracemalloc.start()
+    try:
+        result = rolling_sales_analysis(sample_valid, windows=(10 ** 8,))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < 4 * 1024 * 1024
+    last = list(result['overall'].values())[-1]
+    assert last['rolling_100000000d'] == pytest.approx(
+        sum(tx['Quantity'] * tx['UnitPrice'] for tx in sample_valid)
+    )
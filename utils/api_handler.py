@@ -1,7 +1,5 @@
 
 # utils/api_handler.py
-import requests
-
 BASE_URL = "https://dummyjson.com/products"
 
 def fetch_all_products():
@@ -10,6 +8,9 @@ def fetch_all_products():
     Returns list of product dictionaries
     """
     try:
+        # requests is only needed here, so it is not loaded at import time
+        import requests
+
         response = requests.get(f"{BASE_URL}?limit=100", timeout=10)
         response.raise_for_status()
         data = response.json()
@@ -38,12 +39,25 @@ def create_product_mapping(api_products):
     return mapping
 
 
-def enrich_sales_data(transactions, product_mapping):
+def enrich_sales_data(transactions, product_mapping, fuzzy=True, matcher=None):
     """
     Enriches transaction data using API product mapping
+
+    Transactions are matched by numeric product id first. If that fails
+    and fuzzy is True, the ProductName is matched against the catalog
+    titles (see utils.product_matching); each distinct name is matched once.
+
+    Pass a prebuilt ProductMatcher for the same mapping to reuse its
+    indexes and match cache across calls.
     """
     enriched = []
 
+    if not fuzzy:
+        matcher = None
+    elif matcher is None and product_mapping:
+        from utils.product_matching import ProductMatcher
+        matcher = ProductMatcher(product_mapping)
+
     for txn in transactions:
         new_txn = txn.copy()
         product_id = txn.get("ProductID", "")
@@ -55,6 +69,9 @@ def enrich_sales_data(transactions, product_mapping):
 
         api_product = product_mapping.get(numeric_id)
 
+        if not api_product and matcher:
+            api_product = product_mapping.get(matcher.match(txn.get("ProductName", "")))
+
         if api_product:
             new_txn["API_Category"] = api_product.get("category")
             new_txn["API_Brand"] = api_product.get("brand")
@@ -0,0 +1,117 @@
+# utils/benchmark.py
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules loaded by a plain `python main.py` run before any enrichment
+STARTUP_MODULES = [
+    "main",
+    "utils.file_handler",
+    "utils.ingestion",
+    "utils.data_processor",
+]
+
+# Modules that must not be imported at startup
+DEFERRED_MODULES = [
+    "requests",
+    "urllib3",
+    "numpy",
+    "utils.api_handler",
+]
+
+# Import-time budget in milliseconds, on top of interpreter startup
+DEFAULT_IMPORT_BUDGET_MS = 50.0
+
+_IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{"ms": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure_import_time(module, runs=5):
+    """
+    Imports a module in fresh interpreters and times it
+
+    Returns: dictionary with the median import time in milliseconds and the
+    modules that ended up in sys.modules
+    """
+    times = []
+    loaded = set()
+
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _IMPORT_PROBE.format(module=module)],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        times.append(result["ms"])
+        loaded.update(result["modules"])
+
+    return {
+        "module": module,
+        "median_ms": round(statistics.median(times), 3),
+        "loaded": loaded
+    }
+
+
+def check_startup(budget_ms=DEFAULT_IMPORT_BUDGET_MS, runs=5):
+    """
+    Guards against startup regressions
+
+    Fails when a startup module takes longer than the budget to import or
+    pulls in one of the deferred modules (HTTP stack, NumPy).
+
+    Returns: tuple (passed, list of result lines)
+    """
+    passed = True
+    lines = []
+
+    for module in STARTUP_MODULES:
+        result = measure_import_time(module, runs=runs)
+        eager = [m for m in DEFERRED_MODULES if m in result["loaded"]]
+
+        status = "OK"
+        if result["median_ms"] > budget_ms:
+            status = "SLOW"
+            passed = False
+        if eager:
+            status = "EAGER"
+            passed = False
+
+        line = f"{status:<6}{module:<25}{result['median_ms']:>10.2f} ms"
+        if eager:
+            line += f"  (imports {', '.join(eager)})"
+        lines.append(line)
+
+    return passed, lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sales analytics benchmarks")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_IMPORT_BUDGET_MS,
+                        help="maximum import time per startup module")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    passed, lines = check_startup(args.budget_ms, args.runs)
+    print("IMPORT TIME")
+    print("-" * 40)
+    for line in lines:
+        print(line)
+
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,6 @@
+import gzip
+
+
 def read_and_clean_sales_data(file_path):
     total_records = 0
     invalid_records = 0
@@ -83,13 +86,17 @@ def read_sales_data(filename):
     - Handle FileNotFoundError with appropriate error message
     - Skip the header row
     - Remove empty lines
+    - Files ending in '.gz' are decompressed with gzip
     """
     encodings = ['utf-8', 'latin-1', 'cp1252']
     lines = None
 
+    # Compressed daily drops are read transparently
+    opener = gzip.open if str(filename).endswith('.gz') else open
+
     for enc in encodings:
         try:
-            with open(filename, 'r', encoding=enc) as file:
+            with opener(filename, 'rt', encoding=enc) as file:
                 lines = file.readlines()
             break
         except UnicodeDecodeError:
@@ -181,6 +188,22 @@ def parse_transactions(raw_lines):
     return transactions
 
 
+def is_valid_transaction(tx):
+    """
+    Checks a single parsed transaction against the validation rules
+    used by validate_and_filter
+
+    Returns: True if the transaction is valid, False otherwise
+    """
+    return (
+        tx['Quantity'] > 0 and
+        tx['UnitPrice'] > 0 and
+        tx['TransactionID'].startswith('T') and
+        tx['ProductID'].startswith('P') and
+        tx['CustomerID'].startswith('C')
+    )
+
+
 def validate_and_filter(transactions, region=None, min_amount=None, max_amount=None):
     """
     Validates transactions and applies optional filters
@@ -225,13 +248,7 @@ def validate_and_filter(transactions, region=None, min_amount=None, max_amount=N
     valid_transactions = []
 
     for tx in transactions:
-        if (
-            tx['Quantity'] <= 0 or
-            tx['UnitPrice'] <= 0 or
-            not tx['TransactionID'].startswith('T') or
-            not tx['ProductID'].startswith('P') or
-            not tx['CustomerID'].startswith('C')
-        ):
+        if not is_valid_transaction(tx):
             invalid_count += 1
             continue
 
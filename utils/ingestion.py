@@ -0,0 +1,172 @@
+# utils/ingestion.py
+import glob
+import gzip
+import os
+
+from utils.file_handler import read_sales_data, parse_transactions
+
+DATA_PATTERNS = ['*.txt', '*.txt.gz']
+
+# Header of a sales data file; other '.txt' files (such as the enriched
+# output written next to the data) are not picked up from directories
+SALES_HEADER = "TransactionID|Date|ProductID|ProductName|Quantity|UnitPrice|CustomerID|Region"
+
+
+def _has_sales_header(path):
+    opener = gzip.open if path.endswith('.gz') else open
+    try:
+        with opener(path, 'rb') as f:
+            header = f.readline()
+    except OSError:
+        # Unreadable files are kept so the reader reports the error
+        return True
+    return header.decode('utf-8', errors='replace').lstrip('\ufeff').strip() == SALES_HEADER
+
+
+def resolve_sources(source):
+    """
+    Expands a source specification into an ordered list of files
+
+    Accepts a single file, a directory (all '*.txt' and '*.txt.gz' files
+    in it), a glob pattern, or a list/tuple mixing any of these. Files found
+    through a directory or pattern are only used if their first line is the
+    sales data header; files named directly are always used.
+
+    Returns: list of file paths, sorted within each directory or pattern,
+    without repeats
+    """
+    if isinstance(source, (list, tuple)):
+        specs = list(source)
+    else:
+        specs = [source]
+
+    files = []
+    for spec in specs:
+        spec = str(spec)
+        if os.path.isdir(spec):
+            matches = []
+            for pattern in DATA_PATTERNS:
+                matches.extend(glob.glob(os.path.join(spec, pattern)))
+            files.extend(p for p in sorted(matches) if _has_sales_header(p))
+        elif glob.has_magic(spec):
+            files.extend(sorted(p for p in glob.glob(spec)
+                                if os.path.isfile(p) and _has_sales_header(p)))
+        else:
+            files.append(spec)
+
+    # dict.fromkeys keeps order and drops files named twice
+    return list(dict.fromkeys(files))
+
+
+class TransactionIdSet:
+    """
+    Set of seen TransactionIDs
+
+    IDs of the usual 'T<number>' form are stored as plain integers, any
+    other ID as the string itself, so distinct IDs never collide. The
+    integers only save memory when the transactions themselves are not
+    kept, i.e. when iter_sales_sources is consumed as a stream;
+    read_sales_sources keeps every transaction, and with it the ID string.
+    """
+
+    def __init__(self):
+        self._numeric = set()
+        self._other = set()
+
+    def add(self, transaction_id):
+        """
+        Records an ID
+
+        Returns: True if the ID was new, False if it was already seen
+        """
+        suffix = transaction_id[1:]
+        numeric = (
+            transaction_id.startswith('T') and
+            suffix.isascii() and suffix.isdigit() and
+            not suffix.startswith('0')
+        )
+        if numeric:
+            key, seen = int(suffix), self._numeric
+        else:
+            key, seen = transaction_id, self._other
+
+        if key in seen:
+            return False
+        seen.add(key)
+        return True
+
+    def __len__(self):
+        return len(self._numeric) + len(self._other)
+
+
+def _load_source(filename):
+    raw = read_sales_data(filename)
+    return len(raw), parse_transactions(raw)
+
+
+def iter_sales_sources(files, max_workers=None, use_processes=False, summary=None):
+    """
+    Reads and parses files concurrently and yields one merged stream of
+    transactions, deduplicated by TransactionID
+
+    Files are merged in the given order, so the first occurrence of a
+    duplicated TransactionID wins. Threads suit I/O and gzip-heavy loads;
+    use_processes=True parses on several cores instead.
+
+    If a summary dictionary is given, it is filled with the counts.
+
+    Returns: generator of transaction dictionaries
+    """
+    if summary is None:
+        summary = {}
+    summary.update({'files': len(files), 'raw_lines': 0, 'parsed': 0, 'duplicates': 0})
+
+    if not files:
+        return
+
+    # Imported on demand: the process pool pulls in multiprocessing
+    if use_processes:
+        from concurrent.futures import ProcessPoolExecutor as pool
+    else:
+        from concurrent.futures import ThreadPoolExecutor as pool
+    seen = TransactionIdSet()
+
+    with pool(max_workers=max_workers) as executor:
+        for raw_count, transactions in executor.map(_load_source, files):
+            summary['raw_lines'] += raw_count
+            for tx in transactions:
+                if not seen.add(tx['TransactionID']):
+                    summary['duplicates'] += 1
+                    continue
+                summary['parsed'] += 1
+                yield tx
+
+
+def read_sales_sources(source, max_workers=None, use_processes=False):
+    """
+    Reads, parses and merges sales data from several files
+
+    Parameters:
+    - source: file, directory, glob pattern or list of these (see resolve_sources)
+    - max_workers: number of concurrent readers (optional)
+    - use_processes: parse in worker processes instead of threads
+
+    Returns: tuple (transactions, summary)
+
+    Expected Output Format:
+    (
+        [list of parsed transactions, ready for validate_and_filter],
+        {
+            'files': 3,
+            'raw_lines': 240,
+            'parsed': 230,
+            'duplicates': 4
+        }
+    )
+    """
+    summary = {}
+    files = resolve_sources(source)
+    transactions = list(
+        iter_sales_sources(files, max_workers, use_processes, summary)
+    )
+    return transactions, summary
@@ -0,0 +1,511 @@
+# utils/out_of_core.py
+import argparse
+import gzip
+import heapq
+import os
+import sys
+import tempfile
+import zlib
+from datetime import datetime
+
+from utils.file_handler import parse_transactions, is_valid_transaction
+
+DEFAULT_PARTITIONS = 64
+DEFAULT_TOP_CUSTOMERS = 5
+CHUNK_SIZE = 10000
+
+# Spill files kept open at once; the rest are reopened in append mode.
+# Stays well below the usual limit of 1024 file descriptors.
+MAX_OPEN_SPILL_FILES = 256
+
+# Spill rows buffered in memory (across all files) before they are written
+SPILL_BUFFER_ROWS = 30000
+
+# Spill files hold only the fields the analytics need, prefixed with the
+# row's position in the input so ties can be broken in input order
+SPILL_FIELDS = ['Date', 'ProductName', 'Quantity', 'UnitPrice', 'CustomerID']
+
+# partition set -> field used for hash partitioning
+PARTITION_KEYS = {
+    'customer': 'CustomerID',
+    'product': 'ProductName',
+    'day': 'Date'
+}
+
+
+def _decode_line(raw):
+    for enc in ('utf-8', 'latin-1', 'cp1252'):
+        try:
+            return raw.decode(enc)
+        except UnicodeDecodeError:
+            continue
+    return raw.decode('utf-8', errors='replace')
+
+
+def iter_sales_file(filename, region=None, min_amount=None, max_amount=None):
+    """
+    Streams valid transactions from a sales data file without loading it
+
+    Applies the same parsing, validation and optional filters as
+    read_sales_data -> parse_transactions -> validate_and_filter, but reads
+    the file in chunks of CHUNK_SIZE lines.
+
+    Returns: generator of transaction dictionaries
+    """
+    def valid(chunk):
+        for tx in parse_transactions(chunk):
+            if not is_valid_transaction(tx):
+                continue
+            if region and tx['Region'] != region:
+                continue
+            amount = tx['Quantity'] * tx['UnitPrice']
+            if min_amount is not None and amount < min_amount:
+                continue
+            if max_amount is not None and amount > max_amount:
+                continue
+            yield tx
+
+    opener = gzip.open if str(filename).endswith('.gz') else open
+    try:
+        f = opener(filename, 'rb')
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+        return
+
+    with f:
+        f.readline()  # skip header
+        chunk = []
+        for raw in f:
+            line = _decode_line(raw).strip()
+            if not line:
+                continue
+            chunk.append(line)
+            if len(chunk) >= CHUNK_SIZE:
+                yield from valid(chunk)
+                chunk = []
+        yield from valid(chunk)
+
+
+def _partition_of(key, num_partitions):
+    # crc32 is stable across runs, unlike the built-in hash()
+    return zlib.crc32(key.encode('utf-8')) % num_partitions
+
+
+class SpillWriter:
+    """
+    Appends rows to many spill files while keeping at most `max_open`
+    of them open, closing the least recently used one when needed
+
+    Rows are buffered per file and written out together once `buffer_rows`
+    rows are pending in total, and on close. Each flush then touches every
+    file at most once, so with more files than `max_open` a file is
+    reopened once per flush rather than on most writes.
+    """
+
+    def __init__(self, max_open=MAX_OPEN_SPILL_FILES, buffer_rows=SPILL_BUFFER_ROWS):
+        self.max_open = max_open
+        self.buffer_rows = buffer_rows
+        self.files = {}
+        self.created = set()
+        self.buffers = {}
+        self.pending = 0
+
+    def write(self, path, row):
+        rows = self.buffers.get(path)
+        if rows is None:
+            rows = self.buffers[path] = []
+        rows.append(row)
+        self.pending += 1
+        if self.pending >= self.buffer_rows:
+            self.flush()
+
+    def flush(self):
+        for path, rows in self.buffers.items():
+            self._open(path).write("".join(rows))
+        self.buffers = {}
+        self.pending = 0
+
+    def _open(self, path):
+        f = self.files.pop(path, None)
+        if f is None:
+            if len(self.files) >= self.max_open:
+                oldest = next(iter(self.files))
+                self.files.pop(oldest).close()
+            mode = 'a' if path in self.created else 'w'
+            f = open(path, mode, encoding='utf-8')
+            self.created.add(path)
+        # Re-inserting keeps the dict in least-recently-used order
+        self.files[path] = f
+        return f
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            for f in self.files.values():
+                f.close()
+            self.files = {}
+        return self.created
+
+
+def spill_transactions(transactions, spill_dir, num_partitions=DEFAULT_PARTITIONS):
+    """
+    Hash-partitions transactions into on-disk spill files by customer,
+    product and day in a single pass
+
+    Region totals and overall revenue have few keys, so they are
+    aggregated during the same pass instead of being spilled. Rows are
+    written in batches of SPILL_BUFFER_ROWS with at most
+    MAX_OPEN_SPILL_FILES files open at a time.
+
+    Returns: tuple (paths, region_data, overall_total) where paths maps each
+    partition set name to its list of spill file paths
+    """
+    paths = {
+        name: [os.path.join(spill_dir, f"{name}-{i:04d}.txt") for i in range(num_partitions)]
+        for name in PARTITION_KEYS
+    }
+    writer = SpillWriter()
+
+    region_data = {}
+    overall_total = 0.0
+
+    try:
+        for seq, tx in enumerate(transactions):
+            row = f"{seq}|" + "|".join(repr(tx[k]) if k == 'UnitPrice' else str(tx[k])
+                                       for k in SPILL_FIELDS) + "\n"
+            for name, field in PARTITION_KEYS.items():
+                writer.write(paths[name][_partition_of(tx[field], num_partitions)], row)
+
+            amount = tx['Quantity'] * tx['UnitPrice']
+            overall_total += amount
+            region = tx['Region']
+            if region not in region_data:
+                region_data[region] = {
+                    'total_sales': 0.0,
+                    'transaction_count': 0
+                }
+            region_data[region]['total_sales'] += amount
+            region_data[region]['transaction_count'] += 1
+    finally:
+        created = writer.close()
+
+    # Partitions that received no rows still get an (empty) file
+    for name_paths in paths.values():
+        for path in name_paths:
+            if path not in created:
+                open(path, 'w', encoding='utf-8').close()
+
+    return paths, region_data, overall_total
+
+
+def _read_spill(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            seq, date, product, qty, price, customer = line.rstrip("\n").split("|")
+            yield int(seq), date, product, int(qty), float(price), customer
+
+
+def _customer_partition(path):
+    customers = {}
+    for seq, _, product, qty, price, customer in _read_spill(path):
+        if customer not in customers:
+            customers[customer] = {
+                'first_seq': seq,
+                'total_spent': 0.0,
+                'purchase_count': 0,
+                'products': set()
+            }
+        customers[customer]['total_spent'] += qty * price
+        customers[customer]['purchase_count'] += 1
+        customers[customer]['products'].add(product)
+    return customers
+
+
+def _product_partition(path):
+    products = {}
+    for seq, _, product, qty, price, _ in _read_spill(path):
+        if product not in products:
+            products[product] = {
+                'first_seq': seq,
+                'quantity': 0,
+                'revenue': 0.0
+            }
+        products[product]['quantity'] += qty
+        products[product]['revenue'] += qty * price
+    return products
+
+
+def _day_partition(path):
+    daily = {}
+    for seq, date, _, qty, price, customer in _read_spill(path):
+        if date not in daily:
+            daily[date] = {
+                'first_seq': seq,
+                'revenue': 0.0,
+                'transaction_count': 0,
+                'customers': set()
+            }
+        daily[date]['revenue'] += qty * price
+        daily[date]['transaction_count'] += 1
+        daily[date]['customers'].add(customer)
+    return daily
+
+
+def _top_k(items, k, sort_key):
+    return heapq.nsmallest(k, items, key=sort_key)
+
+
+def out_of_core_analysis(transactions, top_n=5, top_customers=DEFAULT_TOP_CUSTOMERS, threshold=10,
+                         num_partitions=DEFAULT_PARTITIONS, spill_dir=None):
+    """
+    Runs the data_processor analytics on data larger than memory
+
+    Transactions (any iterable, e.g. iter_sales_file) are spilled to hash
+    partitions on disk; each partition is aggregated on its own and the
+    per-partition top-K results are merged into a running top-K. Only one
+    partition's keys, plus the K best so far, are held in memory at a time,
+    which is why the customer result is always bounded.
+
+    Parameters:
+    - top_n: number of products for top_selling_products
+    - top_customers: number of customers to keep (a positive integer)
+    - threshold: quantity threshold for low_performing_products
+    - num_partitions: hash partitions per key (a positive integer)
+    - spill_dir: directory for spill files (a temporary one by default)
+
+    Returns: dictionary with the same results as the in-memory functions:
+    {
+        'total_revenue': ...,          # calculate_total_revenue
+        'region_wise_sales': {...},    # region_wise_sales
+        'top_selling_products': [...], # top_selling_products(n=top_n)
+        'customer_analysis': {...},    # customer_analysis (top_customers)
+        'daily_sales_trend': {...},    # daily_sales_trend
+        'peak_sales_day': (...),       # find_peak_sales_day
+        'low_performing_products': [...]
+    }
+    """
+    for name, k in (('top_n', top_n), ('top_customers', top_customers),
+                    ('num_partitions', num_partitions)):
+        if not isinstance(k, int) or k <= 0:
+            raise ValueError(f"{name} must be a positive integer")
+
+    with tempfile.TemporaryDirectory(dir=spill_dir, prefix="sales-spill-") as tmp:
+        paths, region_data, overall_total = spill_transactions(
+            transactions, tmp, num_partitions
+        )
+
+        # Customers: top-K per partition, then merge
+        customer_key = lambda x: (-x[1]['total_spent'], x[1]['first_seq'])
+        top_customer_items = []
+        for path in paths['customer']:
+            partition = _customer_partition(path)
+            top_customer_items = _top_k(
+                top_customer_items + _top_k(partition.items(), top_customers, customer_key),
+                top_customers,
+                customer_key
+            )
+            del partition
+            os.remove(path)
+
+        customers = {}
+        for customer, data in top_customer_items:
+            customers[customer] = {
+                'total_spent': data['total_spent'],
+                'purchase_count': data['purchase_count'],
+                'avg_order_value': round(data['total_spent'] / data['purchase_count'], 2),
+                'products_bought': sorted(data['products'])
+            }
+
+        # Products: top sellers and low performers
+        top_key = lambda x: (-x[1]['quantity'], x[1]['first_seq'])
+        low_key = lambda x: (x[1]['quantity'], x[1]['first_seq'])
+        top_product_items = []
+        low = []
+        for path in paths['product']:
+            partition = _product_partition(path)
+            top_product_items = _top_k(
+                top_product_items + _top_k(partition.items(), top_n, top_key),
+                top_n,
+                top_key
+            )
+            low.extend(item for item in partition.items() if item[1]['quantity'] < threshold)
+            del partition
+            os.remove(path)
+
+        top_products = [
+            (name, data['quantity'], data['revenue'])
+            for name, data in top_product_items
+        ]
+        low_products = [
+            (name, data['quantity'], round(data['revenue'], 2))
+            for name, data in sorted(low, key=low_key)
+        ]
+
+        # Days: one entry per date, so the trend itself is kept
+        days = {}
+        for path in paths['day']:
+            for date, data in _day_partition(path).items():
+                days[date] = {
+                    'first_seq': data['first_seq'],
+                    'revenue': data['revenue'],
+                    'transaction_count': data['transaction_count'],
+                    'unique_customers': len(data['customers'])
+                }
+            os.remove(path)
+
+    daily = {}
+    for date in sorted(days):
+        daily[date] = {
+            'revenue': round(days[date]['revenue'], 2),
+            'transaction_count': days[date]['transaction_count'],
+            'unique_customers': days[date]['unique_customers']
+        }
+
+    peak = None
+    if days:
+        peak_date, peak_data = min(
+            days.items(), key=lambda x: (-x[1]['revenue'], x[1]['first_seq'])
+        )
+        peak = (peak_date, round(peak_data['revenue'], 2), peak_data['transaction_count'])
+
+    for region in region_data:
+        region_data[region]['percentage'] = round(
+            (region_data[region]['total_sales'] / overall_total) * 100, 2
+        )
+    regions = dict(
+        sorted(
+            region_data.items(),
+            key=lambda x: x[1]['total_sales'],
+            reverse=True
+        )
+    )
+
+    return {
+        'total_revenue': overall_total,
+        'region_wise_sales': regions,
+        'top_selling_products': top_products,
+        'customer_analysis': customers,
+        'daily_sales_trend': daily,
+        'peak_sales_day': peak,
+        'low_performing_products': low_products
+    }
+
+
+def write_out_of_core_report(results, output_file="output/sales_report.txt"):
+    """
+    Writes out_of_core_analysis results in the generate_sales_report layout
+
+    The API enrichment section is left out: enriching every row would need
+    the full transaction list in memory.
+    """
+    regions = results['region_wise_sales']
+    total_revenue = results['total_revenue']
+    total_txns = sum(r['transaction_count'] for r in regions.values())
+    avg_order = total_revenue / total_txns if total_txns else 0
+    daily = results['daily_sales_trend']
+
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write("SALES ANALYTICS REPORT (OUT-OF-CORE)\n")
+        f.write("=" * 40 + "\n")
+        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"Records Processed: {total_txns}\n")
+        f.write("=" * 40 + "\n\n")
+
+        f.write("OVERALL SUMMARY\n")
+        f.write("-" * 40 + "\n")
+        f.write(f"Total Revenue: ₹{total_revenue:,.2f}\n")
+        f.write(f"Total Transactions: {total_txns}\n")
+        f.write(f"Average Order Value: ₹{avg_order:,.2f}\n")
+        if daily:
+            f.write(f"Date Range: {min(daily)} to {max(daily)}\n")
+        f.write("\n")
+
+        f.write("REGION-WISE PERFORMANCE\n")
+        f.write("-" * 40 + "\n")
+        f.write(f"{'Region':<10}{'Sales':>15}{'% Total':>12}{'Txns':>10}\n")
+        for r, s in regions.items():
+            f.write(
+                f"{r:<10}₹{s['total_sales']:>14,.2f}"
+                f"{s['percentage']:>11.2f}%"
+                f"{s['transaction_count']:>10}\n"
+            )
+        f.write("\n")
+
+        top_products = results['top_selling_products']
+        f.write(f"TOP {len(top_products)} PRODUCTS\n")
+        f.write("-" * 40 + "\n")
+        f.write(f"{'Rank':<6}{'Product':<15}{'Qty':>8}{'Revenue':>12}\n")
+        for i, (p, q, r) in enumerate(top_products, 1):
+            f.write(f"{i:<6}{p:<15}{q:>8}₹{r:>11,.2f}\n")
+        f.write("\n")
+
+        customers = results['customer_analysis']
+        f.write(f"TOP {len(customers)} CUSTOMERS\n")
+        f.write("-" * 40 + "\n")
+        f.write(f"{'Rank':<6}{'Customer':<12}{'Spent':>12}{'Orders':>10}\n")
+        for i, (c, d) in enumerate(customers.items(), 1):
+            f.write(
+                f"{i:<6}{c:<12}₹{d['total_spent']:>11,.2f}{d['purchase_count']:>10}\n"
+            )
+        f.write("\n")
+
+        f.write("DAILY SALES TREND\n")
+        f.write("-" * 40 + "\n")
+        f.write(f"{'Date':<12}{'Revenue':>12}{'Txns':>8}{'Customers':>12}\n")
+        for d, s in daily.items():
+            f.write(
+                f"{d:<12}₹{s['revenue']:>11,.2f}"
+                f"{s['transaction_count']:>8}"
+                f"{s['unique_customers']:>12}\n"
+            )
+        f.write("\n")
+
+        peak = results['peak_sales_day']
+        low = results['low_performing_products']
+        f.write("PRODUCT PERFORMANCE ANALYSIS\n")
+        f.write("-" * 40 + "\n")
+        if peak:
+            f.write(f"Best Selling Day: {peak[0]} (₹{peak[1]:,.2f}, {peak[2]} txns)\n")
+        if low:
+            f.write("Low Performing Products:\n")
+            for p, q, r in low:
+                f.write(f" - {p}: {q} units, ₹{r:,.2f}\n")
+        else:
+            f.write("No low performing products.\n")
+
+    print(f"✅ Sales report generated at {output_file}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Out-of-core sales analytics")
+    parser.add_argument("sources", nargs="*", default=["data/sales_data.txt"],
+                        help="files, directories or glob patterns")
+    parser.add_argument("--partitions", type=int, default=DEFAULT_PARTITIONS)
+    parser.add_argument("--top-customers", type=int, default=DEFAULT_TOP_CUSTOMERS)
+    parser.add_argument("--spill-dir", help="directory for spill files")
+    parser.add_argument("--output", default="output/sales_report.txt")
+    args = parser.parse_args(argv)
+
+    from utils.ingestion import resolve_sources
+
+    # Rows are streamed file by file; TransactionID deduplication would need
+    # every ID in memory, so it is not applied here
+    files = resolve_sources(args.sources)
+    transactions = (tx for filename in files for tx in iter_sales_file(filename))
+
+    try:
+        results = out_of_core_analysis(
+            transactions,
+            top_customers=args.top_customers,
+            num_partitions=args.partitions,
+            spill_dir=args.spill_dir
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    write_out_of_core_report(results, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+# utils/product_matching.py
+import re
+
+DEFAULT_MIN_SCORE = 0.75
+
+# Share of a title's trigrams a name must cover when it does not cover
+# the title's last word
+MIN_TITLE_SHARE = 0.5
+
+_CAMEL_CASE = re.compile(r'(?<=[a-z0-9])(?=[A-Z])')
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_title(title):
+    """
+    Normalizes a product name or title for matching
+
+    Splits joined words ('MouseWireless' -> 'mouse wireless'), lowercases
+    and replaces punctuation with single spaces.
+    """
+    title = _CAMEL_CASE.sub(' ', title or '')
+    return _NON_ALNUM.sub(' ', title.lower()).strip()
+
+
+def title_trigrams(normalized):
+    """
+    Returns the set of character trigrams of every token, padded with
+    spaces so word boundaries count
+    """
+    grams = set()
+    for token in normalized.split():
+        padded = f" {token} "
+        for i in range(len(padded) - 2):
+            grams.add(padded[i:i + 3])
+    return grams
+
+
+class ProductMatcher:
+    """
+    Matches sales ProductNames against the API product catalog
+
+    The catalog is indexed once by id, by normalized title, by token and by
+    trigram. Each distinct ProductName is matched at most once; results,
+    including misses, are memoized.
+
+    A fuzzy match scores the fraction of the name's trigrams that also
+    occur in the title. Every match other than an exact title must also
+    cover the title's last word, which is usually the product type, or
+    MIN_TITLE_SHARE of the whole title. So 'Laptop' matches
+    'Asus Zenbook Pro Dual Screen Laptop' but 'Pro' or 'Screen' do not.
+    """
+
+    def __init__(self, product_mapping, min_score=DEFAULT_MIN_SCORE):
+        self.product_mapping = product_mapping
+        self.min_score = min_score
+        self.by_title = {}
+        self.by_token = {}
+        self.by_trigram = {}
+        self.title_length = {}
+        self.title_grams = {}
+        self.head_grams = {}
+        self.cache = {}
+
+        # Lowest id wins when several products share a title or score
+        for pid in sorted(product_mapping, key=lambda p: (p is None, p)):
+            normalized = normalize_title(product_mapping[pid].get("title"))
+            if not normalized:
+                continue
+
+            self.by_title.setdefault(normalized, pid)
+            self.title_length[pid] = len(normalized)
+            self.title_grams[pid] = title_trigrams(normalized)
+            self.head_grams[pid] = title_trigrams(normalized.split()[-1])
+            for token in set(normalized.split()):
+                self.by_token.setdefault(token, []).append(pid)
+            for gram in self.title_grams[pid]:
+                self.by_trigram.setdefault(gram, []).append(pid)
+
+    def match(self, product_name):
+        """
+        Finds the catalog product for a sales ProductName
+
+        Returns: product id, or None if nothing scores at least min_score
+        """
+        if product_name in self.cache:
+            return self.cache[product_name]
+
+        pid = self._match(normalize_title(product_name))
+        self.cache[product_name] = pid
+        return pid
+
+    def _match(self, normalized):
+        if not normalized:
+            return None
+
+        if normalized in self.by_title:
+            return self.by_title[normalized]
+
+        grams = title_trigrams(normalized)
+
+        # Titles containing every token of the name
+        tokens = normalized.split()
+        candidates = None
+        for token in tokens:
+            pids = set(self.by_token.get(token, ()))
+            candidates = pids if candidates is None else candidates & pids
+        for pid in sorted(candidates or (), key=lambda p: (self.title_length[p], p)):
+            if self._covers_title(grams, pid):
+                return pid
+
+        # Fuzzy: count shared trigrams per title via the inverted index
+        shared = {}
+        for gram in grams:
+            for pid in self.by_trigram.get(gram, ()):
+                shared[pid] = shared.get(pid, 0) + 1
+
+        for pid in sorted(shared, key=lambda p: (-shared[p], self.title_length[p], p)):
+            if shared[pid] / len(grams) < self.min_score:
+                break
+            if self._covers_title(grams, pid):
+                return pid
+        return None
+
+    def _covers_title(self, grams, pid):
+        """
+        Checks that a name is specific enough for a title: it covers the
+        title's last word, or MIN_TITLE_SHARE of all of its trigrams
+        """
+        head = self.head_grams[pid]
+        if len(head & grams) / len(head) >= self.min_score:
+            return True
+        title = self.title_grams[pid]
+        return len(title & grams) / len(title) >= MIN_TITLE_SHARE
@@ -0,0 +1,565 @@
+# utils/service.py
+import argparse
+import json
+import os
+import socketserver
+import stat
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from utils.file_handler import parse_transactions, is_valid_transaction
+from utils.data_processor import (
+    calculate_total_revenue,
+    region_wise_sales,
+    top_selling_products,
+    customer_analysis,
+    daily_sales_trend,
+    find_peak_sales_day,
+    low_performing_products
+)
+
+DEFAULT_DATA_FILE = "data/sales_data.txt"
+ENCODINGS = ['utf-8', 'latin-1', 'cp1252']
+TAIL_CHECK_BYTES = 64
+
+# Window sizes accepted by /rolling; each size is also capped at the
+# calendar span by rolling_sales_analysis
+MAX_ROLLING_WINDOWS = 8
+
+# Distinct queries cached per snapshot; query strings are client-controlled
+CACHE_MAX_ENTRIES = 256
+
+# Seconds before a failed product catalog fetch is retried
+CATALOG_RETRY_SECONDS = 60
+
+
+def _decode(raw_bytes):
+    """
+    Decodes file bytes trying the same encodings as read_sales_data
+    """
+    for enc in ENCODINGS:
+        try:
+            return raw_bytes.decode(enc)
+        except UnicodeDecodeError:
+            continue
+    return raw_bytes.decode('utf-8', errors='replace')
+
+
+class LRUCache:
+    """
+    Thread-safe dictionary that keeps at most `max_entries` items,
+    evicting the least recently used one
+    """
+
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._items:
+                return default
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def __len__(self):
+        return len(self._items)
+
+
+class Snapshot:
+    """
+    Immutable view of the loaded data: transactions, indexes and a
+    per-snapshot cache of computed analytics
+
+    A reload builds a new Snapshot and swaps it in, so request threads
+    never see a half-updated state.
+    """
+
+    def __init__(self, version, transactions, by_region, invalid_count):
+        self.version = version
+        self.transactions = transactions
+        self.by_region = by_region
+        self.invalid_count = invalid_count
+        self.cache = LRUCache()
+
+
+class AnalyticsState:
+    """
+    Holds parsed transactions, indexes and the product catalog in memory
+    and keeps them in sync with the data file
+
+    When the file only grew (new rows appended), only the new bytes are
+    read and parsed. Any other change, including an in-place edit that
+    keeps the file size, triggers a full reload.
+
+    A last line without a trailing newline is loaded as a provisional row,
+    as read_sales_data would read it. The loaded offset stays at the start
+    of that line, so the next append parses it again together with the new
+    bytes and the provisional row is replaced.
+
+    Appends are recognised by the file growing while the last
+    TAIL_CHECK_BYTES bytes before the loaded offset are unchanged. An edit
+    earlier in the file made together with an append is therefore missed
+    until the next full reload.
+    """
+
+    def __init__(self, filename=DEFAULT_DATA_FILE, use_api=True):
+        self.filename = filename
+        self.use_api = use_api
+        self._lock = threading.Lock()
+        self._catalog_lock = threading.Lock()
+        self._seen = None
+        self._offset = 0
+        self._tail = b""
+        # (transactions, by_region, invalid_count) of the complete lines
+        self._committed = ([], {}, 0)
+        # (version, product mapping, ProductMatcher)
+        self._catalog = None
+        self._catalog_retry_at = None
+        self.snapshot = Snapshot(0, [], {}, 0)
+        self.refresh()
+
+    def refresh(self):
+        """
+        Reloads the data file if it changed since the last check
+
+        If the file cannot be read, the current snapshot is kept and the
+        file is checked again on the next call.
+
+        Returns: the current Snapshot
+        """
+        try:
+            st = os.stat(self.filename)
+        except FileNotFoundError:
+            print(f"Error: File '{self.filename}' not found.")
+            return self.snapshot
+        except OSError as e:
+            print(f"Error: Cannot read '{self.filename}': {e}")
+            return self.snapshot
+
+        if self._stat_key(st) == self._seen:
+            return self.snapshot
+
+        with self._lock:
+            # Another thread may have reloaded while we waited
+            if self._stat_key(st) == self._seen:
+                return self.snapshot
+
+            try:
+                with open(self.filename, 'rb') as f:
+                    if self._can_append(f, st):
+                        f.seek(self._offset)
+                        self._load(f.read(), st, append=True)
+                    else:
+                        self._load(f.read(), st, append=False)
+            except OSError as e:
+                print(f"Error: Cannot read '{self.filename}': {e}")
+
+        return self.snapshot
+
+    @staticmethod
+    def _stat_key(st):
+        return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _can_append(self, f, st):
+        """
+        Checks whether the file is the one already loaded with new bytes
+        appended after the last processed offset
+        """
+        if self._seen is None or not self._offset:
+            return False
+
+        dev, ino, _, size = self._seen
+        if (st.st_dev, st.st_ino) != (dev, ino):
+            return False
+        # Same size with a new mtime is an in-place edit, not an append
+        if st.st_size <= size:
+            return False
+
+        start = max(0, self._offset - TAIL_CHECK_BYTES)
+        f.seek(start)
+        return f.read(self._offset - start) == self._tail
+
+    @staticmethod
+    def _parse(lines):
+        """
+        Returns: tuple (valid transactions, number of invalid rows)
+        """
+        valid = []
+        invalid_count = 0
+        for tx in parse_transactions([line for line in lines if line]):
+            if is_valid_transaction(tx):
+                valid.append(tx)
+            else:
+                invalid_count += 1
+        return valid, invalid_count
+
+    @staticmethod
+    def _extend(base, valid, invalid_count):
+        """
+        Returns: base (transactions, by_region, invalid_count) with the
+        new rows added; base itself is not modified
+        """
+        transactions, by_region, base_invalid = base
+        by_region = dict(by_region)
+
+        touched = {}
+        for tx in valid:
+            touched.setdefault(tx['Region'], []).append(tx)
+        for region, txs in touched.items():
+            by_region[region] = by_region.get(region, []) + txs
+
+        return transactions + valid, by_region, base_invalid + invalid_count
+
+    def _load(self, data, st, append):
+        # Complete lines are committed; the unterminated rest of the file
+        # is only a provisional row until its newline arrives
+        end = data.rfind(b"\n") + 1
+        chunk, rest = data[:end], data[end:]
+        self._seen = self._stat_key(st)
+
+        lines = [line.strip() for line in _decode(chunk).splitlines()]
+        if not append:
+            if end:
+                lines = lines[1:]  # skip header
+            else:
+                rest = b""  # no complete line: at most a header
+
+        valid, invalid_count = self._parse(lines)
+        base = self._committed if append else ([], {}, 0)
+        self._committed = self._extend(base, valid, invalid_count)
+
+        provisional, provisional_invalid = self._parse([_decode(rest).strip()])
+        transactions, by_region, invalid_count = self._extend(
+            self._committed, provisional, provisional_invalid
+        )
+
+        self._offset = (self._offset if append else 0) + end
+        self._tail = ((self._tail if append else b"") + chunk)[-TAIL_CHECK_BYTES:]
+        old = self.snapshot
+        self.snapshot = Snapshot(old.version + 1, transactions, by_region, invalid_count)
+
+        mode = "Appended" if append else "Loaded"
+        print(f"{mode} {len(valid) + len(provisional)} transactions from {self.filename} "
+              f"(total {len(transactions)})")
+
+    def catalog(self):
+        """
+        Returns the product catalog as (version, mapping, ProductMatcher),
+        fetching it on first use
+
+        The matcher's indexes are built once per catalog. A failed fetch
+        yields an empty catalog that is fetched again after
+        CATALOG_RETRY_SECONDS; each fetch gets a new version.
+        """
+        if self._catalog is None or self._catalog_expired():
+            with self._catalog_lock:
+                if self._catalog is None or self._catalog_expired():
+                    from utils.api_handler import fetch_all_products, create_product_mapping
+                    from utils.product_matching import ProductMatcher
+                    products = fetch_all_products() if self.use_api else []
+                    mapping = create_product_mapping(products)
+                    version = self._catalog[0] + 1 if self._catalog else 1
+                    self._catalog = (version, mapping, ProductMatcher(mapping))
+                    # fetch_all_products returns no products when it fails
+                    if self.use_api and not products:
+                        self._catalog_retry_at = time.monotonic() + CATALOG_RETRY_SECONDS
+                    else:
+                        self._catalog_retry_at = None
+        return self._catalog
+
+    def _catalog_expired(self):
+        return self._catalog_retry_at is not None and time.monotonic() >= self._catalog_retry_at
+
+    def product_mapping(self):
+        """
+        Returns the product catalog mapping (see catalog)
+        """
+        return self.catalog()[1]
+
+    def product_matcher(self):
+        """
+        Returns the ProductMatcher for the catalog, shared by all requests
+        """
+        return self.catalog()[2]
+
+
+def filter_transactions(snapshot, region=None, min_amount=None, max_amount=None):
+    """
+    Applies the validate_and_filter region/amount filters using the
+    in-memory region index
+    """
+    if region:
+        transactions = snapshot.by_region.get(region, [])
+    else:
+        transactions = snapshot.transactions
+
+    if min_amount is None and max_amount is None:
+        return transactions
+
+    result = []
+    for tx in transactions:
+        amount = tx['Quantity'] * tx['UnitPrice']
+        if min_amount is not None and amount < min_amount:
+            continue
+        if max_amount is not None and amount > max_amount:
+            continue
+        result.append(tx)
+    return result
+
+
+def _enrichment_summary(state, transactions):
+    from utils.api_handler import enrich_sales_data
+
+    _, mapping, matcher = state.catalog()
+    enriched = enrich_sales_data(transactions, mapping, matcher=matcher)
+    matched = sum(1 for t in enriched if t["API_Match"])
+    return {
+        "total": len(enriched),
+        "enriched": matched,
+        "success_rate": round(matched / len(enriched) * 100, 2) if enriched else 0,
+        "not_enriched": sorted(set(t["ProductID"] for t in enriched if not t["API_Match"]))
+    }
+
+
+def _peak(transactions):
+    if not transactions:
+        return None
+    date, revenue, count = find_peak_sales_day(transactions)
+    return {"date": date, "revenue": revenue, "transaction_count": count}
+
+
+def _rolling(transactions, params):
+    from utils.windowed_analytics import (
+        rolling_sales_analysis,
+        DEFAULT_WINDOWS,
+        DEFAULT_Z_THRESHOLD
+    )
+
+    windows = DEFAULT_WINDOWS
+    if "windows" in params:
+        windows = tuple(int(w) for w in params["windows"].split(","))
+        if any(w <= 0 for w in windows):
+            raise ValueError("Window sizes must be positive")
+        if len(windows) > MAX_ROLLING_WINDOWS:
+            raise ValueError(f"At most {MAX_ROLLING_WINDOWS} windows are allowed")
+
+    z_threshold = float(params.get("z_threshold", DEFAULT_Z_THRESHOLD))
+    return rolling_sales_analysis(transactions, windows=windows, z_threshold=z_threshold)
+
+
+def _count(params, name, default=None):
+    """
+    Reads a non-negative integer parameter used to slice results
+
+    Returns: the value, or default if the parameter is not given
+    """
+    if name not in params:
+        return default
+    value = int(params[name])
+    if value < 0:
+        raise ValueError(f"{name} must not be negative")
+    return value
+
+
+# endpoint -> (handler(state, transactions, params), extra parameter names)
+ENDPOINTS = {
+    "/revenue": (lambda s, t, p: {"total_revenue": calculate_total_revenue(t)}, ()),
+    "/regions": (lambda s, t, p: region_wise_sales(t) if t else {}, ()),
+    "/top-products": (
+        lambda s, t, p: [
+            {"product": name, "quantity": qty, "revenue": rev}
+            for name, qty, rev in top_selling_products(t, n=_count(p, "n", 5))
+        ],
+        ("n",)
+    ),
+    "/customers": (
+        lambda s, t, p: dict(list(customer_analysis(t).items())[:_count(p, "limit")]),
+        ("limit",)
+    ),
+    "/daily": (lambda s, t, p: daily_sales_trend(t), ()),
+    "/peak": (lambda s, t, p: _peak(t), ()),
+    "/low-products": (
+        lambda s, t, p: [
+            {"product": name, "quantity": qty, "revenue": rev}
+            for name, qty, rev in low_performing_products(t, threshold=int(p.get("threshold", 10)))
+        ],
+        ("threshold",)
+    ),
+    "/transactions": (
+        lambda s, t, p: t[:_count(p, "limit")],
+        ("limit",)
+    ),
+    "/enrichment": (lambda s, t, p: _enrichment_summary(s, t), ()),
+    "/rolling": (lambda s, t, p: _rolling(t, p), ("windows", "z_threshold")),
+}
+
+FILTER_PARAMS = ("region", "min_amount", "max_amount")
+
+# Endpoints whose results also depend on the product catalog
+CATALOG_ENDPOINTS = ("/enrichment",)
+
+# Cached results may legitimately be None (e.g. /peak on no data)
+_MISSING = object()
+
+
+def handle_query(state, path, params):
+    """
+    Answers one analytics query against the current snapshot
+
+    Results are cached per snapshot in a bounded LRU cache, so repeated
+    queries are served without recomputation until the data file (or, for
+    CATALOG_ENDPOINTS, the product catalog) changes.
+
+    Returns: tuple (status_code, payload)
+    """
+    snapshot = state.refresh()
+
+    if path == "/health":
+        return 200, {
+            "status": "ok",
+            "version": snapshot.version,
+            "transactions": len(snapshot.transactions),
+            "invalid": snapshot.invalid_count,
+            "regions": sorted(snapshot.by_region)
+        }
+
+    if path not in ENDPOINTS:
+        return 404, {"error": f"Unknown endpoint: {path}"}
+
+    handler, extra = ENDPOINTS[path]
+    allowed = FILTER_PARAMS + extra
+    unknown = [k for k in params if k not in allowed]
+    if unknown:
+        return 400, {"error": f"Unknown parameters: {', '.join(unknown)}"}
+
+    key = (path, tuple(sorted(params.items())))
+    if path in CATALOG_ENDPOINTS:
+        # A refetched catalog (after a failed fetch) must not hit old results
+        key += (state.catalog()[0],)
+    cached = snapshot.cache.get(key, _MISSING)
+    if cached is not _MISSING:
+        return 200, cached
+
+    try:
+        min_amount = float(params["min_amount"]) if "min_amount" in params else None
+        max_amount = float(params["max_amount"]) if "max_amount" in params else None
+        transactions = filter_transactions(
+            snapshot,
+            region=params.get("region"),
+            min_amount=min_amount,
+            max_amount=max_amount
+        )
+        result = handler(state, transactions, params)
+    except ValueError as e:
+        return 400, {"error": str(e)}
+
+    snapshot.cache.put(key, result)
+    return 200, result
+
+
+class AnalyticsRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves the analytics endpoints as JSON over HTTP
+    """
+
+    state = None
+    quiet = False
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        status, payload = handle_query(self.state, url.path.rstrip("/") or "/health", params)
+
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # Unix socket clients have no (host, port) address
+        if isinstance(self.client_address, tuple):
+            return self.client_address[0]
+        return "unix"
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def _is_socket(path):
+    try:
+        return stat.S_ISSOCK(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def create_server(state, host="127.0.0.1", port=8000, socket_path=None, quiet=False):
+    """
+    Creates a threaded HTTP server bound to a TCP port or a Unix socket
+
+    A stale socket left at socket_path is replaced; any other existing
+    file raises FileExistsError and is left untouched.
+    """
+    handler = type("BoundAnalyticsRequestHandler", (AnalyticsRequestHandler,),
+                   {"state": state, "quiet": quiet})
+
+    if socket_path:
+        if _is_socket(socket_path):
+            os.remove(socket_path)
+        elif os.path.lexists(socket_path):
+            raise FileExistsError(f"'{socket_path}' exists and is not a socket")
+        return ThreadingUnixHTTPServer(socket_path, handler)
+
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sales analytics service")
+    parser.add_argument("--data", default=DEFAULT_DATA_FILE, help="sales data file")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--socket", help="serve on this Unix socket path instead of TCP")
+    parser.add_argument("--no-api", action="store_true", help="do not fetch the product catalog")
+    parser.add_argument("--quiet", action="store_true", help="disable request logging")
+    args = parser.parse_args(argv)
+
+    state = AnalyticsState(args.data, use_api=not args.no_api)
+    try:
+        server = create_server(state, args.host, args.port, args.socket, args.quiet)
+    except FileExistsError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    where = args.socket or f"http://{args.host}:{args.port}"
+    print(f"✅ Sales analytics service listening on {where}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.socket and _is_socket(args.socket):
+            os.remove(args.socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+# utils/windowed_analytics.py
+import math
+from datetime import date, timedelta
+
+DEFAULT_WINDOWS = (7, 30)
+DEFAULT_Z_THRESHOLD = 3.0
+DEFAULT_MIN_HISTORY = 7
+
+
+class RollingWindow:
+    """
+    Fixed-size ring buffer keeping a running sum of the last `size` values
+
+    push() is O(1): the value leaving the window is subtracted as the new
+    one is added.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.values = [0.0] * size
+        self.index = 0
+        self.count = 0
+        self.total = 0.0
+
+    def push(self, value):
+        self.total += value - self.values[self.index]
+        self.values[self.index] = value
+        self.index = (self.index + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+
+class RunningStats:
+    """
+    Welford's online mean and variance
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def std(self):
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self.m2 / (self.count - 1))
+
+    def z_score(self, value):
+        """
+        Returns: z-score of value against the values seen so far, or None
+        if there is no spread yet
+        """
+        std = self.std()
+        if std == 0:
+            return None
+        return (value - self.mean) / std
+
+
+def _parse_day(value):
+    """
+    Returns: the date in canonical ISO form, or None if it is not an
+    ISO date
+    """
+    try:
+        return date.fromisoformat(value).isoformat()
+    except (TypeError, ValueError):
+        return None
+
+
+def _window_series(daily_revenue, days, windows, z_threshold, min_history):
+    """
+    Computes rolling sums, day-over-day growth and anomaly flags for one
+    revenue series in a single pass over the calendar days
+
+    windows is a list of (label, buffer size) pairs.
+    """
+    rolling = [RollingWindow(size) for _, size in windows]
+    stats = RunningStats()
+    previous = None
+    result = {}
+
+    for day in days:
+        revenue = daily_revenue.get(day, 0.0)
+        for window in rolling:
+            window.push(revenue)
+
+        growth = None
+        if previous:
+            growth = round((revenue - previous) / previous * 100, 2)
+
+        # Scored against earlier days only, then added to the history
+        z = stats.z_score(revenue) if stats.count >= min_history else None
+        stats.add(revenue)
+        previous = revenue
+
+        entry = {'revenue': round(revenue, 2)}
+        for (w, _), window in zip(windows, rolling):
+            entry[f'rolling_{w}d'] = round(window.total, 2)
+        entry['growth_pct'] = growth
+        entry['z_score'] = None if z is None else round(z, 2)
+        entry['anomaly'] = z is not None and abs(z) >= z_threshold
+
+        result[day] = entry
+
+    return result
+
+
+def rolling_sales_analysis(transactions, windows=DEFAULT_WINDOWS,
+                           z_threshold=DEFAULT_Z_THRESHOLD,
+                           min_history=DEFAULT_MIN_HISTORY):
+    """
+    Computes rolling-window revenue, day-over-day growth and z-score
+    anomaly flags overall, per region and per product
+
+    One pass over the transactions builds the daily buckets (the same
+    ones daily_sales_trend uses); one pass over the calendar days then
+    produces every window metric. Days without sales count as zero revenue.
+
+    Rows whose Date is not an ISO date (YYYY-MM-DD) still appear in 'daily'
+    but are left out of the windowed series and counted in
+    'skipped_rows'. Windows longer than the calendar span behave like the
+    span, so their buffers are never larger than the number of days.
+
+    Parameters:
+    - windows: rolling window sizes in days
+    - z_threshold: absolute z-score at which a day is flagged as an anomaly
+    - min_history: days of history required before z-scores are reported
+
+    Returns: dictionary
+
+    Expected Output Format:
+    {
+        'daily': {...},          # same as daily_sales_trend
+        'overall': {
+            '2024-12-01': {
+                'revenue': 5313.0,
+                'rolling_7d': 5313.0,
+                'rolling_30d': 5313.0,
+                'growth_pct': None,
+                'z_score': None,
+                'anomaly': False
+            },
+            ...
+        },
+        'by_region': {'North': {date: {...}}, ...},
+        'by_product': {'Laptop': {date: {...}}, ...},
+        'skipped_rows': 0
+    }
+    """
+    daily = {}
+    overall = {}
+    by_region = {}
+    by_product = {}
+    parsed_dates = {}
+    skipped_rows = 0
+
+    for tx in transactions:
+        day = tx['Date']
+        revenue = tx['Quantity'] * tx['UnitPrice']
+
+        if day not in daily:
+            daily[day] = {
+                'revenue': 0.0,
+                'transaction_count': 0,
+                'customers': set()
+            }
+        daily[day]['revenue'] += revenue
+        daily[day]['transaction_count'] += 1
+        daily[day]['customers'].add(tx['CustomerID'])
+
+        # Each distinct date string is parsed once
+        if day not in parsed_dates:
+            parsed_dates[day] = _parse_day(day)
+        iso_day = parsed_dates[day]
+        if iso_day is None:
+            skipped_rows += 1
+            continue
+
+        overall[iso_day] = overall.get(iso_day, 0.0) + revenue
+
+        region_days = by_region.setdefault(tx['Region'], {})
+        region_days[iso_day] = region_days.get(iso_day, 0.0) + revenue
+
+        product_days = by_product.setdefault(tx['ProductName'], {})
+        product_days[iso_day] = product_days.get(iso_day, 0.0) + revenue
+
+    trend = {}
+    for day in sorted(daily):
+        trend[day] = {
+            'revenue': round(daily[day]['revenue'], 2),
+            'transaction_count': daily[day]['transaction_count'],
+            'unique_customers': len(daily[day]['customers'])
+        }
+
+    # Continuous calendar so windows cover days, not rows
+    days = []
+    if overall:
+        current = date.fromisoformat(min(overall))
+        last = date.fromisoformat(max(overall))
+        while current <= last:
+            days.append(current.isoformat())
+            current += timedelta(days=1)
+
+    sized_windows = [(w, max(1, min(w, len(days)))) for w in windows]
+
+    def series(daily_revenue):
+        return _window_series(daily_revenue, days, sized_windows, z_threshold, min_history)
+
+    return {
+        'daily': trend,
+        'overall': series(overall),
+        'by_region': {region: series(d) for region, d in by_region.items()},
+        'by_product': {product: series(d) for product, d in by_product.items()},
+        'skipped_rows': skipped_rows
+    }